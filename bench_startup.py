@@ -0,0 +1,110 @@
+"""
+啟動成本量測：每個頁面在全新的 Python 行程中量一次，避免 sys.modules 快取干擾。
+
+用法：
+    python bench_startup.py            # 每頁量 3 次取中位數
+    python bench_startup.py --runs 5
+
+頁面清單直接取自 views.PAGES，量的是真正的頁面程式碼而不是手動維護的套件清單：
+「共用」是 streamlit + streamlit_option_menu（每頁都要載入）；
+「匯入」是 import views.<模組>（含模組層級的設定）；
+「首次執行」是在 bare mode 下呼叫一次 render()，延遲載入的套件在這一步才真正 import，
+也包含頁面本身的運算與畫圖（未上傳檔案、未按任何按鈕時的預設畫面）。
+「改版前」是原本 app.py 頂端一次匯入全部套件的成本，可用來比較延遲載入省下多少。
+"""
+import argparse
+import importlib.metadata
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+from views import PAGES
+
+BASE_MODULES = ["streamlit", "streamlit_option_menu"]
+
+# 改版前 app.py 頂端的 eager import
+EAGER_MODULES = [
+    "openai", "pandas", "numpy", "matplotlib.pyplot", "seaborn", "plotly.express", "plotly.graph_objects",
+    "streamlit_echarts", "streamlit_extras.add_vertical_space", "streamlit_extras.badges",
+    "streamlit_extras.mention", "streamlit_extras.stoggle", "requests", "bs4",
+]
+
+_PROBE = """
+import importlib, json, sys, time
+base, page, extra = json.loads(sys.argv[1]), sys.argv[2], json.loads(sys.argv[3])
+t0 = time.perf_counter()
+for name in base:
+    importlib.import_module(name)
+t1 = time.perf_counter()
+before = set(sys.modules)
+module = importlib.import_module("views." + page) if page else None
+stopped = None
+for name in extra:
+    try:
+        importlib.import_module(name)
+    except Exception as e:       # 與目前 streamlit 版本不相容的套件：略過並回報
+        stopped = f"{name}: {type(e).__name__}"
+t2 = time.perf_counter()
+if module is not None:
+    try:
+        module.render()
+    except BaseException as e:   # st.stop()、頁面需要的本機檔案不存在等：照樣回報已花的時間
+        stopped = type(e).__name__
+t3 = time.perf_counter()
+loaded = sorted({m.split(".")[0] for m in set(sys.modules) - before} - set(base))
+print(json.dumps({"base": t1 - t0, "import": t2 - t1, "render": t3 - t2, "loaded": loaded,
+                  "modules": len(set(sys.modules) - before), "stopped": stopped}))
+"""
+
+
+def measure(page: str = "", modules=(), runs: int = 3) -> dict:
+    """在新行程中匯入 BASE_MODULES，再匯入並執行 views.<page>（或只匯入 modules），回傳各段秒數的中位數。"""
+    env = {**os.environ, "MPLBACKEND": "Agg"}
+    env.setdefault("OPENROUTER_API_KEY", "bench")   # 讓需要 API key 的頁面跑到預設畫面；不會送出任何請求
+    results = []
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", _PROBE, json.dumps(BASE_MODULES), page, json.dumps(list(modules))],
+            capture_output=True, text=True, check=True, env=env,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        )
+        results.append(json.loads(out.stdout.strip().splitlines()[-1]))
+    summary = {key: statistics.median(r[key] for r in results) for key in ("base", "import", "render")}
+    summary.update({key: results[-1][key] for key in ("loaded", "modules", "stopped")})
+    return summary
+
+
+def requirement_packages(loaded) -> list:
+    """只列出 requirements.txt 中的套件（以已安裝的套件資訊對應頂層模組名，例如 bs4 → beautifulsoup4）。"""
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "requirements.txt")
+    with open(path, encoding="utf-8") as f:
+        wanted = {re.split(r"[<>=!~\[ ;#]", line.strip(), maxsplit=1)[0].lower().replace("_", "-")
+                  for line in f if line.strip() and not line.startswith("#")}
+    distributions = importlib.metadata.packages_distributions()
+    return [name for name in loaded
+            if any(d.lower().replace("_", "-") in wanted for d in distributions.get(name, []))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="量測每個頁面的匯入與首次執行成本")
+    parser.add_argument("--runs", type=int, default=3, help="每頁重複量測次數（取中位數）")
+    args = parser.parse_args()
+
+    rows = [(label.strip(), measure(page=module, runs=args.runs)) for label, module in PAGES.items()]
+    rows.append(("改版前（全部匯入）", measure(modules=EAGER_MODULES, runs=args.runs)))
+
+    print(f"{'頁面':<20}{'共用 (s)':>10}{'匯入 (s)':>10}{'首次執行 (s)':>14}{'合計 (s)':>10}  "
+          f"新載入模組數｜其中 requirements.txt 的套件")
+    for label, r in rows:
+        total = r["base"] + r["import"] + r["render"]
+        note = f"（{r['stopped']}）" if r["stopped"] else ""
+        packages = ", ".join(requirement_packages(r["loaded"])) or "-"
+        print(f"{label:<20}{r['base']:>10.3f}{r['import']:>10.3f}{r['render']:>14.3f}{total:>10.3f}  "
+              f"{r['modules']:>5}｜{packages}{note}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""app.py 與各頁面（views/）共用的效能工具（延遲載入、快取、爬蟲、LLM 呼叫等）。"""
@@ -0,0 +1,25 @@
+"""
+圖表前的伺服器端彙總：先依分類欄 groupby，再把每個分類一個點 / 一根長條送到瀏覽器。
+"""
+import streamlit as st
+
+AGGREGATIONS = {      # 顯示名稱 → pandas 彙總函式
+    "加總": "sum",
+    "平均": "mean",
+    "筆數": "count",
+    "中位數": "median",
+}
+
+
+def aggregate(df, x: str, y: str, agg: str = "sum"):
+    """依 x 分組彙總 y，回傳兩欄（x, y）的 DataFrame；分類欄只保留實際出現的值。"""
+    if agg not in AGGREGATIONS.values():
+        raise ValueError(f"不支援的彙總方式：{agg}")
+    grouped = df.groupby(x, observed=True, sort=True)[y].agg(agg)
+    return grouped.reset_index()
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def get_aggregate(dataset_key: str, x: str, y: str, agg: str, _df):
+    """同一份資料（dataset_key）同一組 (x, y, agg) 只彙總一次。"""
+    return aggregate(_df, x, y, agg)
@@ -0,0 +1,140 @@
+"""
+共用連線：HTTP Session 與 OpenRouter（OpenAI 相容）Client。
+
+兩者都用 st.cache_resource 做成行程內共用的單例，跨 rerun、跨 session 重複使用，
+保留 TCP/TLS keep-alive 與連線池；只有在參數（secrets 內容、連線池設定）改變時才會重建。
+"""
+import os
+
+import streamlit as st
+
+from core.lazy import lazy_import
+
+openai = lazy_import("openai")
+requests = lazy_import("requests")
+
+DEFAULT_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0 Safari/537.36"
+)
+
+# 連線池 / 節流預設值；可在 secrets.toml 或環境變數以同名鍵覆寫
+CLIENT_DEFAULTS = {
+    "HTTP_POOL_CONNECTIONS": 8,     # 爬蟲：不同 host 的連線池數量
+    "HTTP_POOL_MAXSIZE": 16,        # 爬蟲：每個 host 最多保留的連線數
+    "HTTP_MAX_RETRIES": 2,          # 爬蟲：連線錯誤 / 5xx 的重試次數
+    "LLM_MAX_CONNECTIONS": 10,      # OpenRouter：同時連線上限
+    "LLM_KEEPALIVE": 5,             # OpenRouter：保持 keep-alive 的閒置連線數
+    "LLM_KEEPALIVE_EXPIRY": 60.0,   # OpenRouter：閒置連線保留秒數
+    "LLM_MAX_RETRIES": 2,           # OpenRouter：連線失敗 / 逾時的重試次數（由 LLM 節流器以指數退避執行，SDK 內建重試關閉）
+    "LLM_TIMEOUT": 60.0,            # OpenRouter：單次請求逾時秒數
+    "RATE_PER_SEC": 2.0,            # LLM 節流：每秒請求數上限（遇 429 自動下修，成功後慢慢回升）
+    "RATE_BURST": 4,                # LLM 節流：token bucket 容量（可瞬間連發的請求數）
+    "RATE_MAX_RETRIES": 4,          # LLM 節流：遇 429 / 5xx 的重試次數（與 LLM_MAX_RETRIES 分開計算）
+    "RATE_BACKOFF_BASE": 1.0,       # LLM 節流：指數退避起始秒數
+    "RATE_BACKOFF_MAX": 30.0,       # LLM 節流：單次退避上限秒數
+    "REPLY_CACHE_PATH": os.path.join(".cache", "llm_replies.sqlite3"),   # LLM 回覆快取：SQLite 檔案位置
+    "REPLY_CACHE_MAX_ENTRIES": 2000,    # LLM 回覆快取：最多保留筆數（超過依最近使用淘汰）
+    "REPLY_CACHE_TTL": 86400.0,         # LLM 回覆快取：每筆有效秒數
+}
+
+
+def get_setting(name: str, default=None):
+    """優先讀 secrets，再退環境變數；沒有 secrets.toml 時不報錯。"""
+    try:
+        value = st.secrets.get(name)
+    except Exception:
+        value = None
+    if value is None:
+        value = os.getenv(name, default)
+    return value
+
+
+def client_settings(prefix: str) -> dict:
+    """讀取 prefix（"HTTP_" / "LLM_" / "RATE_" / "REPLY_CACHE_"）開頭的設定，鍵名去掉前綴轉小寫，可直接當關鍵字參數傳入。"""
+    return {
+        k[len(prefix):].lower(): type(v)(get_setting(k, v))
+        for k, v in CLIENT_DEFAULTS.items()
+        if k.startswith(prefix)
+    }
+
+
+def openrouter_secrets() -> dict:
+    """讀取 OpenRouter 相關 secrets；api_key 可能為 None，由呼叫端決定如何提示。"""
+    return {
+        "api_key": get_setting("OPENROUTER_API_KEY"),
+        "base_url": get_setting("OPENROUTER_BASE_URL", "https://openrouter.ai/api/v1"),
+        "app_url": get_setting("APP_URL"),
+        "app_name": get_setting("APP_NAME"),  # 只用 ASCII，避免 'ascii' codec 錯誤
+    }
+
+
+@st.cache_resource(show_spinner=False)
+def get_http_session(
+    user_agent: str = DEFAULT_USER_AGENT,
+    pool_connections: int = 8,
+    pool_maxsize: int = 16,
+    max_retries: int = 2,
+):
+    """行程共用的 requests.Session：掛上有連線池與重試的 HTTPAdapter。"""
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    retry = Retry(
+        total=max_retries,
+        connect=max_retries,
+        read=max_retries,
+        backoff_factor=0.5,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({"User-Agent": user_agent, "Connection": "keep-alive"})
+    return session
+
+
+@st.cache_resource(show_spinner=False)
+def get_openrouter_client(
+    api_key: str,
+    base_url: str,
+    app_url: str = None,
+    app_name: str = None,
+    max_connections: int = 10,
+    keepalive: int = 5,
+    keepalive_expiry: float = 60.0,
+    max_retries: int = 2,
+    timeout: float = 60.0,
+):
+    """行程共用的 OpenAI Client（指向 OpenRouter）；secrets 或連線設定改變時自動重建。"""
+    default_headers = {}
+    if app_url:
+        default_headers["HTTP-Referer"] = app_url
+    if app_name:
+        default_headers["X-Title"] = app_name
+
+    # 用 SDK 自帶的 http client 類別與 Limits 型別，不直接依賴 httpx 版本
+    Limits = type(openai.DEFAULT_CONNECTION_LIMITS)
+    http_client = openai.DefaultHttpxClient(
+        limits=Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=keepalive,
+            keepalive_expiry=keepalive_expiry,
+        ),
+        timeout=timeout,
+    )
+    return openai.OpenAI(
+        api_key=api_key,
+        base_url=base_url,
+        default_headers=default_headers or None,
+        max_retries=max_retries,
+        timeout=timeout,
+        http_client=http_client,
+    )
@@ -0,0 +1,217 @@
+"""
+新聞爬蟲：列表頁擷取標題連結、文章頁擷取內文，並以執行緒池同時抓取多個網站與文章。
+
+- 每個 host 有同時連線上限（per_host），避免對單一網站瞬間送出大量請求
+- 整體有截止時間（deadline），逾時就回傳已完成的部分結果
+- 列表頁走磁碟 HTTP 快取（core/http_cache.py），以條件式 GET 重新驗證
+- 文章內文邊下載邊擷取（core/extract.py），可依網站指定內文選擇器
+- 輸出欄位維持 新聞媒體 / 新聞標題 / 新聞內容 / 新聞網址，後續建 DataFrame 不需變動
+
+這裡的函式會在背景執行緒執行，不可呼叫 st.warning 等 UI 元件；錯誤訊息收集在 CrawlResult.errors，
+由主執行緒決定如何顯示。
+"""
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from urllib.parse import urljoin, urlparse
+
+import streamlit as st
+
+from core.clients import get_http_session, client_settings
+from core.extract import extract_text
+from core.http_cache import get_http_cache
+from core.lazy import lazy_attr
+
+BeautifulSoup = lazy_attr("bs4", "BeautifulSoup")
+
+REQUEST_TIMEOUT = 12
+CONTENT_BUDGET = 500       # 每篇文章保留的字數
+LIST_FRESH_FOR = 300       # 列表頁快取在這段時間內不重新驗證（秒）
+LIST_STALE_FOR = 86400     # 超過 fresh 但在這段時間內：先回舊內容、背景重新驗證（秒）
+TIMEOUT_CONTENT = "文章內容抓取逾時"
+
+
+class CrawlError(Exception):
+    """列表頁抓取失敗（連線錯誤、非 200）；訊息可直接顯示給使用者。"""
+
+
+@dataclass
+class CrawlResult:
+    articles: list = field(default_factory=list)   # 依網站選擇順序、列表頁順序排列
+    errors: list = field(default_factory=list)     # 給使用者看的錯誤訊息
+    timed_out: bool = False                        # 是否因 deadline 提前結束
+    cancelled: bool = False                        # 是否因 cancel 被設定而提前結束
+    elapsed: float = 0.0
+
+
+def _session():
+    return get_http_session(**client_settings("HTTP_"))
+
+
+def _base_of(url: str) -> str:
+    p = urlparse(url)
+    return f"{p.scheme}://{p.netloc}"
+
+
+@st.cache_data(show_spinner=False, ttl=600)
+def fetch_news_content(url: str, selectors=None) -> str:
+    """
+    抓取新聞文章前 CONTENT_BUDGET 字做分析。
+
+    selectors 為該網站的內文選擇器（例如 ("div.story",)），未指定或沒命中時退回 <article>/<p>/<div>/<span>。
+    邊下載邊解析，字數額度用完就中斷下載。
+    """
+    try:
+        res = _session().get(url, timeout=REQUEST_TIMEOUT, stream=True)
+    except Exception as e:
+        return f"文章內容抓取失敗：{e}"
+
+    with res:
+        if res.status_code != 200:
+            return f"文章內容抓取失敗：HTTP {res.status_code}"
+        try:
+            merged = extract_text(res.iter_content(chunk_size=16 * 1024), selectors, budget=CONTENT_BUDGET)
+        except Exception as e:
+            return f"文章內容抓取失敗：{e}"
+    return merged if merged else "無法抓取文章內容"
+
+
+def fetch_headline_links(list_url: str, site_name: str, tag: str, keyword: str = "華碩") -> list:
+    """
+    從網站列表頁抓取含關鍵字的 (標題, 連結)；失敗時拋出 CrawlError。
+
+    列表頁經過磁碟 HTTP 快取（core/http_cache.py）：LIST_FRESH_FOR 秒內直接使用，
+    之後以 ETag / Last-Modified 條件式請求重新驗證，未變更時只需一個 304。
+    """
+    try:
+        res = get_http_cache().get(_session(), list_url, timeout=REQUEST_TIMEOUT,
+                                   fresh_for=LIST_FRESH_FOR, stale_for=LIST_STALE_FOR)
+    except Exception as e:
+        raise CrawlError(f"{site_name} 連線失敗：{e}") from e
+
+    if res.status_code != 200:
+        raise CrawlError(f"{site_name} 回應碼 {res.status_code}（可能擋爬或需 JS）。")
+
+    soup = BeautifulSoup(res.text, "html.parser")
+    base = _base_of(list_url)
+
+    links = []
+    for h in soup.find_all(tag):
+        title = (h.get_text() or "").strip()
+        if not title or keyword not in title:
+            continue
+        a = h.find("a", href=True)
+        if not a:
+            continue
+        links.append((title, urljoin(base, a["href"].strip())))
+    return links
+
+
+class HostLimiter:
+    """每個 host 一個 semaphore，限制同一網站的同時請求數。"""
+
+    def __init__(self, per_host: int):
+        self.per_host = max(1, per_host)
+        self._lock = threading.Lock()
+        self._sems = {}
+
+    def _sem(self, url: str) -> threading.BoundedSemaphore:
+        host = urlparse(url).netloc
+        with self._lock:
+            if host not in self._sems:
+                self._sems[host] = threading.BoundedSemaphore(self.per_host)
+            return self._sems[host]
+
+    def run(self, url: str, fn, *args, **kwargs):
+        with self._sem(url):
+            return fn(*args, **kwargs)
+
+
+def crawl_sites(
+    sites: dict,
+    keyword: str,
+    *,
+    max_workers: int = 8,
+    per_host: int = 2,
+    deadline: float = 45.0,
+    on_progress=None,
+    on_article=None,
+    cancel=None,
+) -> CrawlResult:
+    """
+    同時抓取多個網站的列表頁與文章內文。
+
+    sites: {網站名稱: {"url": 列表頁網址, "tag": 標題標籤, "content": 內文選擇器（選填）}}，順序即輸出順序。
+    on_progress(done, total): 每完成一個請求就在呼叫端執行緒回報一次，可用來更新進度條。
+    on_article(article): 每篇文章內文抓完（含失敗）就在呼叫端執行緒交出，可邊抓邊處理。
+    cancel: threading.Event；被設定時停止等待，回傳已完成的部分結果（cancelled=True）。
+    """
+    start = time.monotonic()
+    end = start + deadline
+    limiter = HostLimiter(per_host)
+    result = CrawlResult()
+
+    pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="crawler")
+    jobs = {}       # future -> ("list", site_idx, site_name) / ("article", site_idx, n, article)
+    slots = {}      # (site_idx, n) -> article dict
+    try:
+        for site_idx, (site_name, site) in enumerate(sites.items()):
+            fut = pool.submit(limiter.run, site["url"], fetch_headline_links,
+                              site["url"], site_name, site["tag"], keyword)
+            jobs[fut] = ("list", site_idx, site_name)
+
+        pending = set(jobs)
+        done_count = 0
+        while pending:
+            if cancel is not None and cancel.is_set():
+                result.cancelled = True
+                break
+            remaining = end - time.monotonic()
+            if remaining <= 0:
+                result.timed_out = True
+                result.errors.extend(
+                    f"{jobs[f][2]} 列表頁抓取逾時" for f in pending if jobs[f][0] == "list"
+                )
+                break
+            # 有 cancel 時最多等 0.5 秒就回頭檢查一次
+            timeout = min(remaining, 0.5) if cancel is not None else remaining
+            done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            for fut in done:
+                done_count += 1
+                job = jobs[fut]
+                if job[0] == "list":
+                    _, site_idx, site_name = job
+                    try:
+                        links = fut.result()
+                    except CrawlError as e:
+                        result.errors.append(str(e))
+                        continue
+                    except Exception as e:
+                        result.errors.append(f"{site_name} 解析失敗：{e}")
+                        continue
+                    selectors = tuple(sites[site_name].get("content") or ()) or None
+                    for n, (title, news_url) in enumerate(links):
+                        article = {"新聞媒體": site_name, "新聞標題": title,
+                                   "新聞內容": TIMEOUT_CONTENT, "新聞網址": news_url}
+                        slots[(site_idx, n)] = article
+                        art_fut = pool.submit(limiter.run, news_url, fetch_news_content, news_url, selectors)
+                        jobs[art_fut] = ("article", site_idx, n, article)
+                        pending.add(art_fut)
+                else:
+                    article = job[3]
+                    try:
+                        article["新聞內容"] = fut.result()
+                    except Exception as e:
+                        article["新聞內容"] = f"文章內容抓取失敗：{e}"
+                    if on_article:
+                        on_article(article)
+            if on_progress:
+                on_progress(done_count, len(jobs))
+    finally:
+        # 逾時 / 取消時不等待仍在執行的請求（它們受 REQUEST_TIMEOUT 限制，會自行結束）
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    result.articles = [slots[k] for k in sorted(slots)]
+    result.elapsed = time.monotonic() - start
+    return result
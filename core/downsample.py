@@ -0,0 +1,89 @@
+"""
+圖表前的降採樣：把長序列縮到大約圖表的像素寬度再送到瀏覽器，並保留峰值。
+
+- 折線圖用 LTTB（Largest-Triangle-Three-Buckets），形狀與原序列幾乎一致；
+- 散點圖用每桶最小 / 最大值，極端點一定會被畫出來。
+"""
+import numpy as np
+
+from core.lazy import lazy_import
+
+pd = lazy_import("pandas")
+
+DEFAULT_MAX_POINTS = 2000   # 約為寬螢幕圖表的像素寬度；再多點肉眼也分不出來
+
+
+def _as_float(values) -> np.ndarray:
+    """數值 / 日期欄轉成 float 座標（日期以 ns 計），供三角形面積計算。"""
+    values = np.asarray(values)
+    if np.issubdtype(values.dtype, np.datetime64):
+        return values.astype("datetime64[ns]").astype(np.int64).astype(float)
+    return values.astype(float)
+
+
+def lttb_indices(x, y, n_out: int) -> np.ndarray:
+    """
+    LTTB 選點：首尾固定，中間每桶挑與「前一選點、下一桶平均點」所成三角形面積最大的點。
+    x 須遞增；回傳選中的列位置（遞增）。
+    """
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    x, y = _as_float(x), _as_float(y)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)   # 中間 n_out-2 個桶的邊界
+    picked = np.empty(n_out, dtype=np.intp)
+    picked[0], picked[-1] = 0, n - 1
+    prev = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        nlo, nhi = hi, (edges[i + 2] if i + 2 < len(edges) else n)
+        avg_x, avg_y = x[nlo:nhi].mean(), y[nlo:nhi].mean()
+        area = np.abs((x[prev] - avg_x) * (y[lo:hi] - y[prev]) - (x[prev] - x[lo:hi]) * (avg_y - y[prev]))
+        prev = lo + int(area.argmax())
+        picked[i + 1] = prev
+    return picked
+
+
+def minmax_indices(y, n_out: int) -> np.ndarray:
+    """每桶保留最小值與最大值兩點（共約 n_out 點），回傳遞增的列位置。"""
+    n = len(y)
+    if n_out >= n or n_out < 2:
+        return np.arange(n)
+    y = _as_float(y)
+    buckets = max(n_out // 2, 1)
+    starts = np.linspace(0, n, buckets + 1).astype(int)[:-1]
+    bucket_of = np.repeat(np.arange(buckets), np.diff(np.append(starts, n)))
+    # 依 (桶, 值) 排序後，每桶第一個 / 最後一個即最小 / 最大
+    order = np.lexsort((y, bucket_of))
+    first = np.searchsorted(bucket_of[order], np.arange(buckets), side="left")
+    last = np.searchsorted(bucket_of[order], np.arange(buckets), side="right") - 1
+    return np.unique(np.concatenate((order[first], order[last])))
+
+
+def downsample(df, y: str, x: str = None, max_points: int = DEFAULT_MAX_POINTS, method: str = "lttb"):
+    """
+    把 df 縮到最多約 max_points 列，回傳 (縮小後的 df, {"drawn", "total"})。
+
+    x 為 None 時用 index（例如以日期為 index 的 df_chart）；非數值 / 日期的 x 以列順序當座標。
+    y 為缺值的列先略過，避免 NaN 影響面積計算。
+    """
+    total = len(df)
+    if total <= max_points:
+        return df, {"drawn": total, "total": total}
+    valid = df[y].notna().to_numpy()
+    if not valid.all():
+        df = df[valid]
+    xs = df.index if x is None else df[x]
+    if method == "minmax":
+        picked = minmax_indices(df[y], max_points)
+    else:
+        numeric_x = pd.api.types.is_numeric_dtype(xs) or pd.api.types.is_datetime64_any_dtype(xs)
+        picked = lttb_indices(xs if numeric_x else np.arange(len(df)), df[y], max_points)
+    return df.iloc[picked], {"drawn": len(picked), "total": total}
+
+
+def points_caption(info: dict) -> str:
+    """一行說明：實際畫出的點數 / 原始列數。"""
+    if info["drawn"] >= info["total"]:
+        return f"📉 繪製 {info['total']:,} 點（未降採樣）"
+    return f"📉 繪製 {info['drawn']:,} / {info['total']:,} 點（已降採樣，保留峰值）"
@@ -0,0 +1,142 @@
+"""
+文章內文擷取：邊下載邊解析，字數額度用完就停止。
+
+- 以 stdlib HTMLParser 逐段 feed，不必把整頁讀進記憶體再建 DOM
+- 只收「位於選擇器命中元素之內」的文字節點，每個節點只收一次，巢狀 div/span 不會重複
+- 支援簡易 CSS 選擇器：tag、.class、#id、tag.class、tag#id（可多個 class）
+"""
+import codecs
+import re
+from html.parser import HTMLParser
+
+DEFAULT_SELECTORS = ("article", "p", "div", "span")
+SKIP_TAGS = {"script", "style", "noscript", "template", "svg", "head"}
+VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+BLOCK_TAGS = {"article", "section", "div", "p", "li", "br", "h1", "h2", "h3", "h4", "h5", "h6", "blockquote", "tr"}
+
+_SELECTOR = re.compile(r"^(?P<tag>[a-zA-Z][\w-]*)?(?P<rest>(?:[.#][\w-]+)*)$")
+
+
+def parse_selector(selector: str):
+    """把簡易選擇器轉成 (tag, id, {classes})；不支援的語法拋出 ValueError。"""
+    m = _SELECTOR.match(selector.strip())
+    if not m or not selector.strip():
+        raise ValueError(f"不支援的選擇器：{selector!r}")
+    tag = (m.group("tag") or "").lower() or None
+    ident, classes = None, set()
+    for kind, name in re.findall(r"([.#])([\w-]+)", m.group("rest")):
+        if kind == "#":
+            ident = name
+        else:
+            classes.add(name)
+    return tag, ident, frozenset(classes)
+
+
+def _matches(rule, tag: str, attrs: dict) -> bool:
+    r_tag, r_id, r_classes = rule
+    if r_tag and r_tag != tag:
+        return False
+    if r_id and attrs.get("id") != r_id:
+        return False
+    if r_classes and not r_classes <= set((attrs.get("class") or "").split()):
+        return False
+    return True
+
+
+class ArticleTextParser(HTMLParser):
+    """收集選擇器命中元素內的文字，累積到 budget 字就把 done 設為 True。"""
+
+    def __init__(self, selectors=DEFAULT_SELECTORS, budget: int = 500):
+        super().__init__(convert_charrefs=True)
+        self.rules = [parse_selector(s) for s in selectors]
+        self.budget = budget
+        self.done = False
+        self._stack = []        # [(tag, 是否命中, 是否略過)]
+        self._inside = 0        # 目前位於幾層命中元素之內
+        self._skip = 0          # 目前位於幾層 script/style 之內
+        self._blocks = []
+        self._line = []
+        self._seen = set()
+        self._size = 0
+
+    # --- HTMLParser hooks ---
+    def handle_starttag(self, tag, attrs):
+        if tag in BLOCK_TAGS:
+            self._flush()
+        if tag in VOID_TAGS:
+            return
+        attrs = dict(attrs)
+        hit = any(_matches(rule, tag, attrs) for rule in self.rules)
+        skip = tag in SKIP_TAGS
+        self._stack.append((tag, hit, skip))
+        self._inside += hit
+        self._skip += skip
+
+    def handle_startendtag(self, tag, attrs):
+        if tag in BLOCK_TAGS:
+            self._flush()
+
+    def handle_endtag(self, tag):
+        if tag in BLOCK_TAGS:
+            self._flush()
+        # 容忍未關閉的標籤：往回找到同名元素為止，一起彈出
+        for depth in range(len(self._stack) - 1, -1, -1):
+            if self._stack[depth][0] == tag:
+                for _, hit, skip in self._stack[depth:]:
+                    self._inside -= hit
+                    self._skip -= skip
+                del self._stack[depth:]
+                break
+
+    def handle_data(self, data):
+        if self.done or self._skip or not self._inside:
+            return
+        self._line.append(data)
+
+    # --- 結果 ---
+    def _flush(self):
+        line = " ".join("".join(self._line).split())
+        self._line = []
+        if not line or line in self._seen or self.done:
+            return
+        self._seen.add(line)
+        self._blocks.append(line)
+        self._size += len(line) + 1
+        if self._size >= self.budget:
+            self.done = True
+
+    def text(self) -> str:
+        self._flush()
+        return "\n".join(self._blocks)[:self.budget]
+
+
+def extract_text(chunks, selectors=DEFAULT_SELECTORS, budget: int = 500,
+                 encoding: str = "utf-8", max_bytes: int = 2_000_000) -> str:
+    """
+    從位元組區塊（例如 response.iter_content()）擷取內文前 budget 字。
+
+    指定的 selectors 沒有命中任何文字時，改用 DEFAULT_SELECTORS 的結果（同一次解析一併收集）。
+    """
+    selectors = tuple(selectors or DEFAULT_SELECTORS)
+    parsers = [ArticleTextParser(selectors, budget)]
+    if selectors != DEFAULT_SELECTORS:
+        parsers.append(ArticleTextParser(DEFAULT_SELECTORS, budget))
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    read = 0
+    for chunk in chunks:
+        if not chunk:
+            continue
+        read += len(chunk)
+        html = decoder.decode(chunk)
+        for parser in parsers:
+            if not parser.done:
+                parser.feed(html)
+        if parsers[0].done or read >= max_bytes:
+            break
+    for parser in parsers:
+        parser.feed(decoder.decode(b"", final=True))
+    for parser in parsers:
+        text = parser.text()
+        if text:
+            return text
+    return ""
@@ -0,0 +1,79 @@
+"""
+圖表介紹頁的成品快取：相同圖表、相同參數只建一次圖。
+
+- matplotlib：快取 savefig 後的 PNG bytes（與 st.pyplot 相同的 dpi / 裁邊），顯示時直接 st.image；
+- Plotly：快取建好的 Figure 物件本身。Streamlit 的 st.plotly_chart 收到 dict / JSON 會整份重新驗證，
+  實測比重建還慢；收到 Figure 則只做 to_dict，所以這裡直接共用 Figure（建好後不再修改）。
+"""
+import io
+
+import streamlit as st
+
+from core.lazy import lazy_import
+
+plt = lazy_import("matplotlib.pyplot")
+go = lazy_import("plotly.graph_objects")
+
+PNG_DPI = 200   # 與 st.pyplot 預設一致
+# 中文字體（避免亂碼）：依序取第一個系統上有的字型
+CJK_FONTS = ["Microsoft JhengHei", "Noto Sans CJK TC", "PingFang TC", "Heiti TC", "Arial Unicode MS"]
+
+
+def use_cjk_fonts():
+    """設定 matplotlib 的中文字體（rcParams 為行程全域設定）；所有頁面畫圖前都經過這裡，不受頁面載入順序影響。"""
+    if plt.rcParams["font.sans-serif"][:len(CJK_FONTS)] != CJK_FONTS:
+        plt.rcParams["font.sans-serif"] = CJK_FONTS + [f for f in plt.rcParams["font.sans-serif"] if f not in CJK_FONTS]
+    plt.rcParams["axes.unicode_minus"] = False
+
+
+def matplotlib_png(chart: str, params: tuple, build) -> bytes:
+    """
+    以 (chart, params, 目前字型設定) 為鍵快取 matplotlib 圖的 PNG。build(*params) 回傳 Figure，
+    須只依賴 params 與靜態資料（不參與雜湊）。字型設定列入鍵值，rcParams 改變後不會沿用舊字型畫的圖。
+    """
+    use_cjk_fonts()
+    fonts = (plt.rcParams["font.family"][0], *plt.rcParams["font.sans-serif"])
+    return _png(chart, params, fonts, build)
+
+
+@st.cache_data(show_spinner=False, max_entries=128)
+def _png(chart: str, params: tuple, fonts: tuple, _build) -> bytes:
+    """畫完即關閉 Figure，避免 pyplot 累積未釋放的圖。"""
+    fig = _build(*params)
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", bbox_inches="tight", dpi=PNG_DPI)
+    plt.close(fig)
+    return buf.getvalue()
+
+
+@st.cache_resource(show_spinner=False, max_entries=128)
+def plotly_figure(chart: str, params: tuple, _build):
+    """以 (chart, params) 為鍵快取 Plotly Figure；回傳的物件為所有 session 共用，勿就地修改。"""
+    return _build(*params)
+
+
+def gauge_grid(labels, values, columns: int = 3, max_items: int = 24,
+               value_range=(0, 100), title_suffix: str = "", row_height: int = 220):
+    """
+    多個儀表放在同一張 Figure：以 layout.grid 切出 rows × columns 的格子，每個 Indicator 指定自己的格位。
+    一次送出一份 Plotly payload，不再每列一張圖。超過 max_items 只畫前 max_items 個。
+    """
+    labels, values = list(labels)[:max_items], list(values)[:max_items]
+    columns = max(1, min(columns, len(values) or 1))
+    rows = -(-len(values) // columns)
+    fig = go.Figure([
+        go.Indicator(
+            mode="gauge+number",
+            value=value,
+            title={"text": f"{label}{title_suffix}"},
+            gauge={"axis": {"range": list(value_range)}},
+            domain={"row": i // columns, "column": i % columns},
+        )
+        for i, (label, value) in enumerate(zip(labels, values))
+    ])
+    fig.update_layout(
+        grid={"rows": rows, "columns": columns, "pattern": "independent"},
+        height=row_height * rows,
+        margin={"t": 40, "b": 10, "l": 30, "r": 30},
+    )
+    return fig
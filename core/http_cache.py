@@ -0,0 +1,167 @@
+"""
+列表頁的持久化 HTTP 快取（條件式 GET + stale-while-revalidate）。
+
+- 回應內容與 ETag / Last-Modified 存在磁碟（預設 .cache/http/），重啟後仍可使用
+- fresh_for 秒內直接用快取；之後到 stale_for 秒內先回傳舊內容，同時在背景以
+  If-None-Match / If-Modified-Since 重新驗證；超過 stale_for 才同步重新驗證
+- 伺服器回 304 時只更新時間戳記，不重新下載內容
+"""
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+
+import streamlit as st
+
+DEFAULT_DIR = os.path.join(".cache", "http")
+
+
+@dataclass
+class CachedResponse:
+    status_code: int
+    content: bytes
+    source: str             # "fresh" / "stale" / "revalidated"（304）/ "network"
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+
+class HttpCache:
+    def __init__(self, directory: str = DEFAULT_DIR, max_entries: int = 500):
+        self.directory = directory
+        self.max_entries = max_entries
+        self.counts = {"fresh": 0, "stale": 0, "revalidated": 0, "network": 0}
+        self._lock = threading.Lock()
+        self._inflight = set()
+        os.makedirs(directory, exist_ok=True)
+
+    # --- 磁碟存取 ---
+    def _paths(self, url: str):
+        key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        base = os.path.join(self.directory, key)
+        return base + ".json", base + ".body"
+
+    def _load(self, url: str):
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(body_path, "rb") as f:
+                body = f.read()
+        except (OSError, ValueError):
+            return None, None
+        return meta, body
+
+    def _write(self, path: str, data: bytes):
+        """寫到同目錄下的唯一暫存檔再 os.replace，多個執行緒同時寫同一網址也不會互相踩到。"""
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            raise
+
+    def _store(self, url: str, meta: dict, body: bytes = None):
+        meta_path, body_path = self._paths(url)
+        if body is not None:
+            self._write(body_path, body)
+        self._write(meta_path, json.dumps(meta).encode("utf-8"))
+
+    def _prune(self):
+        metas = [os.path.join(self.directory, n) for n in os.listdir(self.directory) if n.endswith(".json")]
+        if len(metas) <= self.max_entries:
+            return
+        metas.sort(key=os.path.getmtime)
+        for meta_path in metas[:len(metas) - self.max_entries]:
+            for path in (meta_path, meta_path[:-len(".json")] + ".body"):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    # --- 網路 ---
+    def _revalidate(self, session, url: str, timeout: float, meta: dict, body: bytes):
+        """送出條件式 GET；304 回傳舊內容，200 存入新內容，其他狀態碼原樣回傳不快取。"""
+        headers = {}
+        if meta and meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta and meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        res = session.get(url, timeout=timeout, headers=headers)
+        now = time.time()
+        if res.status_code == 304 and body is not None:
+            self._store(url, {**meta, "fetched_at": now})
+            return CachedResponse(200, body, "revalidated")
+        if res.status_code == 200:
+            self._store(url, {
+                "url": url,
+                "etag": res.headers.get("ETag"),
+                "last_modified": res.headers.get("Last-Modified"),
+                "fetched_at": now,
+            }, res.content)
+            self._prune()
+        return CachedResponse(res.status_code, res.content, "network")
+
+    def _revalidate_in_background(self, session, url, timeout, meta, body):
+        with self._lock:
+            if url in self._inflight:
+                return
+            self._inflight.add(url)
+
+        def run():
+            try:
+                response = self._revalidate(session, url, timeout, meta, body)
+            except Exception:
+                return  # 背景更新失敗就沿用舊內容，下次再試
+            finally:
+                with self._lock:
+                    self._inflight.discard(url)
+            with self._lock:
+                self.counts[response.source] += 1
+
+        threading.Thread(target=run, name="http-cache-revalidate", daemon=True).start()
+
+    def get(self, session, url: str, timeout: float = 12,
+            fresh_for: float = 300, stale_for: float = 86400) -> CachedResponse:
+        meta, body = self._load(url)
+        age = time.time() - meta["fetched_at"] if meta else None
+
+        if age is not None and age < fresh_for:
+            source = "fresh"
+            response = CachedResponse(200, body, source)
+        elif age is not None and age < stale_for:
+            self._revalidate_in_background(session, url, timeout, meta, body)
+            source = "stale"
+            response = CachedResponse(200, body, source)
+        else:
+            try:
+                response = self._revalidate(session, url, timeout, meta, body)
+            except Exception:
+                if body is None:
+                    raise
+                response = CachedResponse(200, body, "stale")  # 連線失敗時退回舊內容
+            source = response.source
+        with self._lock:
+            self.counts[source] += 1
+        return response
+
+    def caption(self) -> str:
+        c = self.counts
+        return (
+            f"🌐 列表頁 HTTP 快取：直接使用 {c['fresh']}、先用舊內容背景更新 {c['stale']}、"
+            f"304 未變更 {c['revalidated']}、完整下載 {c['network']}"
+        )
+
+
+@st.cache_resource(show_spinner=False)
+def get_http_cache(directory: str = DEFAULT_DIR, max_entries: int = 500) -> HttpCache:
+    return HttpCache(directory, max_entries)
@@ -0,0 +1,92 @@
+"""
+上傳資料的查詢索引：讓篩選互動不必每次掃描整個 DataFrame。
+"""
+import numpy as np
+import streamlit as st
+
+from core.ingest import parse_dates
+from core.lazy import lazy_import
+
+pd = lazy_import("pandas")
+
+
+def sort_by_date(df, column: str):
+    """把 column 轉成 datetime 並依日期穩定排序（NaT 排最後），供 date_slice 二分搜尋使用。"""
+    if not pd.api.types.is_datetime64_any_dtype(df[column]):
+        df[column] = parse_dates(df[column])
+    if not df[column].is_monotonic_increasing:
+        df = df.sort_values(column, kind="stable", na_position="last", ignore_index=True)
+    return df
+
+
+def date_bounds(df, column: str):
+    """已排序日期欄的 (最小, 最大) Timestamp；全為 NaT 時回傳 (None, None)。"""
+    values = df[column].to_numpy()
+    valid = len(values) - int(np.isnat(values[::-1]).argmin()) if len(values) else 0
+    if valid == 0 or np.isnat(values[0]):
+        return None, None
+    return pd.Timestamp(values[0]), pd.Timestamp(values[valid - 1])
+
+
+def date_slice_bounds(df, column: str, start, end):
+    """以二分搜尋找出 start ~ end（含 end 當天整天）的列位置 [lo, hi)；df 須先經 sort_by_date 排序。"""
+    values = df[column].to_numpy()
+    lo = values.searchsorted(pd.Timestamp(start).to_datetime64(), side="left")
+    hi = values.searchsorted((pd.Timestamp(end) + pd.Timedelta(days=1)).to_datetime64(), side="left")
+    return int(lo), int(hi)
+
+
+def date_slice(df, column: str, start, end):
+    """取出 start ~ end 的列，回傳連續切片（iloc 視圖），不建布林遮罩。"""
+    lo, hi = date_slice_bounds(df, column, start, end)
+    return df.iloc[lo:hi]
+
+
+class GroupIndex:
+    """
+    分類欄（型號 / 地區 / 通路等）的倒排索引：每個值對應到已排序的列位置陣列。
+
+    建一次 O(n log n)；之後列出某段列範圍內出現的值、或取出多個值的列，都只需二分搜尋，
+    不必再對整欄做 unique() 或等值比較。
+    """
+
+    def __init__(self, series):
+        codes, uniques = pd.factorize(series, sort=True)
+        order = np.argsort(codes, kind="stable")
+        counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+        starts = np.concatenate(([0], np.cumsum(counts)))
+        offset = int((codes < 0).sum())     # NaN 的 code 為 -1，排在最前面
+        self.values = list(uniques)
+        self._positions = {
+            value: order[offset + starts[i]:offset + starts[i + 1]]
+            for i, value in enumerate(self.values)
+        }
+
+    def _count_in(self, positions, lo, hi) -> int:
+        return int(positions.searchsorted(hi) - positions.searchsorted(lo))
+
+    def values_in(self, lo: int = 0, hi: int = None) -> list:
+        """列位置 [lo, hi) 之間實際出現的值（依排序）。"""
+        if hi is None:
+            return list(self.values)
+        return [v for v in self.values if self._count_in(self._positions[v], lo, hi)]
+
+    def positions(self, values, lo: int = 0, hi: int = None):
+        """多個值在 [lo, hi) 之間的列位置（遞增排序，維持原本的日期順序）。"""
+        parts = []
+        for v in values:
+            pos = self._positions.get(v)
+            if pos is None:
+                continue
+            if hi is not None:
+                pos = pos[pos.searchsorted(lo):pos.searchsorted(hi)]
+            parts.append(pos)
+        if not parts:
+            return np.array([], dtype=np.intp)
+        return np.sort(np.concatenate(parts)) if len(parts) > 1 else parts[0]
+
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def get_group_index(dataset_key: str, column: str, _df) -> GroupIndex:
+    """每份資料（dataset_key，例如上傳檔案的內容雜湊）每個欄位只建一次 GroupIndex。"""
+    return GroupIndex(_df[column])
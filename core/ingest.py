@@ -0,0 +1,300 @@
+"""
+上傳檔案的讀取與解析快取。
+
+- 以檔案內容雜湊為鍵，解析結果以 Arrow Table（欄式）保存；同一份檔案在任何 rerun、
+  任何 session 只解析一次，快取依最近使用順序（LRU）淘汰，總記憶體不超過 budget_bytes
+- 大型 CSV 分塊讀取：只偵測一次編碼（後段解碼失敗才換下一個編碼重讀）、逐塊縮小數值型別、
+  第一塊就能預覽，並有列數 / 記憶體上限
+- 載入後壓縮欄位型別（category / 較小數值型別 / datetime），快取與各 session 都用壓縮後的版本
+"""
+import codecs
+import hashlib
+import io
+import re
+import threading
+from collections import OrderedDict
+
+import streamlit as st
+
+from core.lazy import lazy_import
+
+pd = lazy_import("pandas")
+pa = lazy_import("pyarrow")
+
+
+_digest_memo = {}     # UploadedFile.file_id -> 內容雜湊，避免每次 rerun 重算整份檔案的 sha256
+_digest_lock = threading.Lock()
+
+
+def file_digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def uploaded_digest(uploaded_file) -> str:
+    """上傳檔案的內容雜湊；同一次上傳（file_id 相同）只計算一次。"""
+    file_id = getattr(uploaded_file, "file_id", None)
+    with _digest_lock:
+        if file_id and file_id in _digest_memo:
+            return _digest_memo[file_id]
+    digest = file_digest(uploaded_file.getvalue())
+    if file_id:
+        with _digest_lock:
+            if len(_digest_memo) > 1000:
+                _digest_memo.clear()
+            _digest_memo[file_id] = digest
+    return digest
+
+
+def parse_table(data: bytes, filename: str):
+    """依副檔名以 pandas 解析 csv / xlsx。"""
+    if filename.rsplit(".", 1)[-1].lower() == "csv":
+        return pd.read_csv(io.BytesIO(data))
+    return pd.read_excel(io.BytesIO(data), engine="openpyxl")
+
+
+class FrameCache:
+    """內容定址的 DataFrame 快取；值為 Arrow Table，無法轉 Arrow 的欄位組合則直接存 DataFrame。"""
+
+    def __init__(self, budget_bytes: int):
+        self.budget_bytes = budget_bytes
+        self.used_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict()     # digest -> (value, info, nbytes)
+        self._lock = threading.Lock()
+
+    def get(self, digest: str):
+        """命中時回傳 (DataFrame, info)，未命中回傳 None。"""
+        with self._lock:
+            item = self._items.get(digest)
+            if item is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(digest)
+            self.hits += 1
+            value, info, _ = item
+        if isinstance(value, pd.DataFrame):
+            return value.copy(), dict(info)
+        return value.to_pandas(), dict(info)
+
+    def put(self, digest: str, df, info: dict = None):
+        try:
+            value = pa.Table.from_pandas(df, preserve_index=False)
+            nbytes = value.nbytes
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            value = df.copy()
+            nbytes = int(df.memory_usage(deep=True).sum())
+        if nbytes > self.budget_bytes:
+            return  # 單一檔案就超過預算時不快取
+        with self._lock:
+            if digest in self._items:
+                self.used_bytes -= self._items.pop(digest)[2]
+            self._items[digest] = (value, dict(info or {}), nbytes)
+            self.used_bytes += nbytes
+            while self.used_bytes > self.budget_bytes:
+                _, (_, _, evicted) = self._items.popitem(last=False)
+                self.used_bytes -= evicted
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"entries": len(self._items), "used_bytes": self.used_bytes,
+                    "budget_bytes": self.budget_bytes, "hits": self.hits, "misses": self.misses}
+
+
+@st.cache_resource(show_spinner=False)
+def get_frame_cache(budget_mb: int = 512) -> FrameCache:
+    return FrameCache(budget_mb * 1024 * 1024)
+
+
+def load_uploaded_frame(uploaded_file, cache: FrameCache = None, sort_by: str = None):
+    """
+    讀取 st.file_uploader 的檔案並壓縮欄位型別，回傳 (DataFrame, info)；
+    相同內容直接從快取還原，不再重新解析。info["memory"] 為 optimize_frame 的前後記憶體報告。
+
+    sort_by 為日期欄名時，載入當下就轉成 datetime 並依日期排序（見 core/indexes.sort_by_date），
+    之後日期篩選可直接二分搜尋。
+    """
+    from core.indexes import sort_by_date
+
+    cache = cache or get_frame_cache()
+    key = f"{uploaded_digest(uploaded_file)}:sort:{sort_by}" if sort_by else uploaded_digest(uploaded_file)
+    hit = cache.get(key)
+    if hit is not None:
+        df, info = hit
+        return df, {**info, "cached": True}
+    df, memory = optimize_frame(parse_table(uploaded_file.getvalue(), uploaded_file.name))
+    if sort_by and sort_by in df.columns:
+        df = sort_by_date(df, sort_by)
+    info = {"rows": len(df), "memory": memory, "key": key}
+    cache.put(key, df, info)
+    return df, {**info, "cached": False}
+
+
+# =========================================================
+# 📥 大型 CSV 分塊讀取
+# =========================================================
+ENCODINGS = ("utf-8", "cp950", "gb18030")   # 依序嘗試；都失敗時退回 latin-1（任何位元組都能解碼）
+SNIFF_BYTES = 64 * 1024
+
+
+def sniff_encoding(sample: bytes, truncated: bool = False) -> str:
+    """
+    以檔案開頭樣本判斷編碼：BOM → UTF-8 → Big5(cp950) → GB18030 → latin-1。
+    truncated=True 表示樣本不是整份檔案，結尾 4 bytes 內的解碼錯誤視為樣本切在多位元組字元中間。
+    """
+    if sample.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    for encoding in ENCODINGS:
+        try:
+            sample.decode(encoding)
+            return encoding
+        except UnicodeDecodeError as e:
+            if truncated and e.start >= len(sample) - 4:
+                return encoding
+    return "latin-1"
+
+
+def downcast_numeric(df):
+    """整數欄縮成最小可容納的整數型別；浮點欄在數值不失真時才縮成 float32。"""
+    for col in df.select_dtypes(include="integer").columns:
+        df[col] = pd.to_numeric(df[col], downcast="integer")
+    for col in df.select_dtypes(include="float").columns:
+        small = pd.to_numeric(df[col], downcast="float")
+        if small.dtype != df[col].dtype and small.astype(df[col].dtype).equals(df[col]):
+            df[col] = small
+    return df
+
+
+# =========================================================
+# 🗜 欄位型別壓縮
+# =========================================================
+_DATE_LIKE = re.compile(r"^\s*\d{4}[-/.]\d{1,2}[-/.]\d{1,2}([ T]\d{1,2}:\d{2}(:\d{2})?)?\s*$")
+
+
+def _looks_like_dates(col, sample_size: int = 200, threshold: float = 0.9) -> bool:
+    sample = col.dropna()
+    if sample.empty:
+        return False
+    sample = sample.sample(min(sample_size, len(sample)), random_state=0).astype(str)
+    return sample.str.match(_DATE_LIKE).mean() >= threshold
+
+
+def parse_dates(series):
+    """文字欄轉 datetime：先用 pandas 的格式推論（快），有值被轉成 NaT 時才改逐筆解析混合格式。"""
+    parsed = pd.to_datetime(series, errors="coerce")
+    if parsed.isna().sum() > series.isna().sum():
+        parsed = pd.to_datetime(series, errors="coerce", format="mixed")
+    return parsed
+
+
+def optimize_frame(df, max_category_ratio: float = 0.5):
+    """
+    載入後一次性壓縮欄位型別，回傳 (df, report)：
+    - 像日期的文字欄（YYYY-MM-DD 等）轉成 datetime64
+    - 重複值多的文字欄（相異值 / 列數 ≤ max_category_ratio）轉成 category
+    - 數值欄縮小型別（見 downcast_numeric）
+    report 含 before / after 位元組數與各欄的型別變更。
+    """
+    before = int(df.memory_usage(deep=True).sum())
+    original = df.dtypes.astype(str).to_dict()
+    df = downcast_numeric(df)
+    rows = len(df)
+    for col in df.columns:
+        series = df[col]
+        if not (pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series)):
+            continue
+        if _looks_like_dates(series):
+            parsed = parse_dates(series)
+            if parsed.notna().sum() >= series.notna().sum() * 0.9:
+                df[col] = parsed
+                continue
+        if rows and series.nunique(dropna=True) / rows <= max_category_ratio:
+            df[col] = series.astype("category")
+    after = int(df.memory_usage(deep=True).sum())
+    changes = {
+        col: f"{original[col]} → {dtype}"
+        for col, dtype in df.dtypes.astype(str).items()
+        if original.get(col) != dtype
+    }
+    return df, {"before": before, "after": after, "changes": changes}
+
+
+def memory_caption(report: dict) -> str:
+    """optimize_frame 報告的一行摘要。"""
+    mb = 1024 * 1024
+    saved = 1 - report["after"] / report["before"] if report["before"] else 0.0
+    return (
+        f"🗜 欄位型別壓縮：記憶體 {report['before'] / mb:.1f} MB → {report['after'] / mb:.1f} MB"
+        f"（節省 {saved:.0%}，調整 {len(report['changes'])} 欄）"
+    )
+
+
+def read_csv_chunked(uploaded_file, *, chunk_rows: int = 100_000, max_rows: int = None,
+                     max_bytes: int = None, on_chunk=None):
+    """
+    分塊讀取 CSV，回傳 (DataFrame, info)。
+
+    on_chunk(chunk, rows_loaded, fraction) 在每塊讀完後呼叫（第一塊可用來立即顯示預覽）。
+    超過 max_rows 列或 max_bytes 記憶體時停止讀取，info["truncated"] 為 True。
+    編碼只看開頭 64 KB；之後才出現無法解碼的位元組時，改用下一個候選編碼從頭重讀。
+    """
+    size = uploaded_file.size if hasattr(uploaded_file, "size") else len(uploaded_file.getvalue())
+    uploaded_file.seek(0)
+    sample = uploaded_file.read(SNIFF_BYTES)
+    sniffed = sniff_encoding(sample, truncated=len(sample) < size)
+    candidates = [sniffed] + [e for e in ENCODINGS + ("latin-1",) if e != sniffed.replace("-sig", "")]
+
+    for attempt, encoding in enumerate(candidates):
+        uploaded_file.seek(0)
+        try:
+            result = _read_chunks(uploaded_file, encoding, size, chunk_rows, max_rows, max_bytes, on_chunk)
+            break
+        except (UnicodeDecodeError, pd.errors.ParserError):
+            if attempt == len(candidates) - 1:
+                raise
+    chunks, rows, used, raw, truncated = result
+    df = pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame()
+    return df, {"encoding": encoding, "rows": rows, "bytes": used, "raw_bytes": raw, "truncated": truncated}
+
+
+def _read_chunks(uploaded_file, encoding, size, chunk_rows, max_rows, max_bytes, on_chunk):
+    chunks, rows, used, raw, truncated = [], 0, 0, 0, False
+    reader = pd.read_csv(uploaded_file, encoding=encoding, chunksize=chunk_rows, low_memory=False)
+    with reader:
+        for chunk in reader:
+            if max_rows is not None and rows + len(chunk) > max_rows:
+                chunk = chunk.iloc[:max_rows - rows]
+                truncated = True
+            raw += int(chunk.memory_usage(deep=True).sum())
+            chunk = downcast_numeric(chunk)
+            chunks.append(chunk)
+            rows += len(chunk)
+            used += int(chunk.memory_usage(deep=True).sum())
+            if max_bytes is not None and used >= max_bytes:
+                truncated = True
+            if on_chunk:
+                fraction = 1.0 if truncated else min(1.0, uploaded_file.tell() / size) if size else 1.0
+                on_chunk(chunk, rows, fraction)
+            if truncated:
+                break
+    return chunks, rows, used, raw, truncated
+
+
+def load_uploaded_csv(uploaded_file, cache: FrameCache = None, *, max_rows: int = None,
+                      max_bytes: int = None, on_chunk=None):
+    """
+    read_csv_chunked + optimize_frame，再加上內容定址快取；
+    命中時不會呼叫 on_chunk，info["cached"] 為 True。
+    """
+    cache = cache or get_frame_cache()
+    key = f"{uploaded_digest(uploaded_file)}:csv:{max_rows}:{max_bytes}"
+    hit = cache.get(key)
+    if hit is not None:
+        df, info = hit
+        return df, {**info, "cached": True}
+    df, info = read_csv_chunked(uploaded_file, max_rows=max_rows, max_bytes=max_bytes, on_chunk=on_chunk)
+    df, info["memory"] = optimize_frame(df)
+    info["key"] = key
+    info["memory"]["before"] = info["raw_bytes"]  # 分塊時已先縮小數值型別，改以原始解析大小為準
+    cache.put(key, df, info)
+    return df, {**info, "cached": False}
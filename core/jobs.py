@@ -0,0 +1,162 @@
+"""
+新聞搜尋的背景工作：爬取 → 議題分類在背景執行緒進行，不綁在某一次 script run 上。
+
+- 工作物件放在 st.session_state，任何 widget 互動造成的 rerun 都不會中斷它；
+- 爬蟲每抓完一篇就交給分類執行緒，分類完成的新聞立刻出現在 rows，畫面以 fragment 輪詢顯示；
+- cancel() 後兩個執行緒都會在下一個檢查點停下，已分類的結果保留。
+
+這裡的程式碼跑在背景執行緒，不可呼叫 st.* UI 元件，也不可寫 st.session_state；
+結果由主執行緒（fragment）讀 snapshot() 後自行寫入。
+"""
+import queue
+import threading
+import time
+import uuid
+
+from core.crawler import crawl_sites
+from core.topics import MAX_BATCH_ITEMS, classify_topics
+
+BATCH_WAIT = 1.0    # 分類執行緒湊批次最多等待秒數：太短會變成一則一個請求，太長則結果延遲出現
+_DONE = object()
+
+
+class NewsSearchJob:
+    """一次新聞搜尋。start() 後在背景執行；以 snapshot() 讀取目前進度與已分類的新聞。"""
+
+    def __init__(self, client, sites: dict, keyword: str, *, topic_cache=None,
+                 per_host: int = 2, deadline: float = 45.0):
+        self.id = uuid.uuid4().hex[:8]
+        self.client = client
+        self.sites = sites
+        self.keyword = keyword
+        self.topic_cache = topic_cache
+        self.per_host = per_host
+        self.deadline = deadline
+
+        self.status = "pending"      # pending / running / done / cancelled / failed
+        self.rows = []               # 已分類完成的新聞（依完成順序）
+        self.articles = []           # 爬取結束後依網站 / 列表順序的完整清單
+        self.errors = []
+        self.timed_out = False
+        self.fetched = 0
+        self.crawl_done = False
+        self.cache_hits = 0
+        self.started = None
+        self.finished = None
+
+        self._cancel = threading.Event()
+        self._lock = threading.Lock()
+        self._queue = queue.Queue()
+        self._threads = [
+            threading.Thread(target=self._crawl, name=f"news-crawl-{self.id}", daemon=True),
+            threading.Thread(target=self._classify, name=f"news-classify-{self.id}", daemon=True),
+        ]
+
+    # ---------- 主執行緒使用 ----------
+    def start(self) -> "NewsSearchJob":
+        self.status, self.started = "running", time.monotonic()
+        for thread in self._threads:
+            thread.start()
+        return self
+
+    def cancel(self):
+        self._cancel.set()
+
+    @property
+    def running(self) -> bool:
+        return self.status in ("pending", "running")
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "status": self.status,
+                "rows": list(self.rows),
+                "fetched": self.fetched,
+                "classified": len(self.rows),
+                "crawl_done": self.crawl_done,
+                "elapsed": (self.finished or time.monotonic()) - (self.started or time.monotonic()),
+            }
+
+    def results(self) -> list:
+        """結束後的最終結果：依網站 / 列表順序，只含已分類的新聞（取消時為部分結果）。"""
+        with self._lock:
+            ordered = [a for a in self.articles if "議題" in a]
+            return ordered if len(ordered) == len(self.rows) else list(self.rows)
+
+    # ---------- 背景執行緒 ----------
+    def _on_article(self, article):
+        with self._lock:
+            self.fetched += 1
+        self._queue.put(article)
+
+    def _crawl(self):
+        emitted = set()
+
+        def on_article(article):
+            emitted.add(id(article))
+            self._on_article(article)
+
+        try:
+            crawl = crawl_sites(self.sites, self.keyword, per_host=self.per_host, deadline=self.deadline,
+                                on_article=on_article, cancel=self._cancel)
+            with self._lock:
+                self.articles = crawl.articles
+                self.errors.extend(crawl.errors)
+                self.timed_out = crawl.timed_out
+            # 逾時未抓完內文的文章也照原本流程送去分類（內容為逾時訊息）
+            if not crawl.cancelled:
+                for article in crawl.articles:
+                    if id(article) not in emitted:
+                        self._on_article(article)
+        except Exception as e:
+            with self._lock:
+                self.errors.append(f"爬取失敗：{e}")
+        finally:
+            with self._lock:
+                self.crawl_done = True
+            self._queue.put(_DONE)
+
+    def _next_batch(self):
+        """阻塞取第一則，之後在 BATCH_WAIT 內盡量湊滿一批；回傳 (批次, 是否已收到結束訊號)。"""
+        batch, finished = [], False
+        item = self._queue.get()
+        deadline = time.monotonic() + BATCH_WAIT
+        while True:
+            if item is _DONE:
+                finished = True
+                break
+            batch.append(item)
+            if len(batch) >= MAX_BATCH_ITEMS:
+                break
+            try:
+                item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                break
+        return batch, finished
+
+    def _classify(self):
+        stats = {"cache_hits": 0}
+        status = "done"
+        try:
+            finished = False
+            while not finished:
+                batch, finished = self._next_batch()
+                if self._cancel.is_set():
+                    status = "cancelled"
+                    break
+                if not batch:
+                    continue
+                topics = classify_topics(self.client, batch, cache=self.topic_cache, stats=stats)
+                with self._lock:
+                    self.cache_hits = stats["cache_hits"]
+                    for article, topic in zip(batch, topics):
+                        article["議題"] = topic
+                        self.rows.append(article)
+        except Exception as e:
+            status = "failed"
+            with self._lock:
+                self.errors.append(f"議題分類失敗：{e}")
+        finally:
+            with self._lock:
+                self.status = status
+                self.finished = time.monotonic()
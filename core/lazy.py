@@ -0,0 +1,54 @@
+"""
+延遲載入（lazy import）
+
+app.py 頂端原本一次匯入 matplotlib / seaborn / plotly / openai / bs4 等重量級套件，
+每次啟動都得全部付出匯入成本。這裡提供代理物件：名稱照舊定義在檔案頂端，
+但真正的 import 延後到第一次取用屬性或呼叫時才發生，因此每個頁面只會載入它實際用到的套件。
+
+注意：本模組不可 import 任何重量級套件，否則就失去延遲載入的意義。
+"""
+import importlib
+import types
+
+
+class LazyModule(types.ModuleType):
+    """模組代理：第一次取用屬性時才真正 import，之後直接轉交給真正的模組。"""
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__["_lazy_module"] = None
+
+    def _load(self):
+        module = self.__dict__["_lazy_module"]
+        if module is None:
+            module = importlib.import_module(self.__name__)
+            self.__dict__["_lazy_module"] = module
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = "loaded" if self.__dict__["_lazy_module"] is not None else "not loaded"
+        return f"<lazy module '{self.__name__}' ({state})>"
+
+
+def lazy_import(name: str) -> LazyModule:
+    """取代 `import name`：回傳延遲載入的模組代理。"""
+    return LazyModule(name)
+
+
+def lazy_attr(module_name: str, attr: str):
+    """取代 `from module_name import attr`（attr 須為函式或類別）：第一次呼叫時才 import。"""
+    module = LazyModule(module_name)
+
+    def _proxy(*args, **kwargs):
+        return getattr(module, attr)(*args, **kwargs)
+
+    _proxy.__name__ = attr
+    _proxy.__qualname__ = attr
+    _proxy.__doc__ = f"延遲載入的 {module_name}.{attr}"
+    return _proxy
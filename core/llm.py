@@ -0,0 +1,306 @@
+"""
+LLM 呼叫共用工具（OpenRouter / OpenAI 相容介面）。
+"""
+import json
+import random
+import re
+import threading
+import time
+from collections import deque
+from email.utils import parsedate_to_datetime
+from types import SimpleNamespace
+
+import streamlit as st
+
+from core.lazy import lazy_import
+
+openai = lazy_import("openai")
+
+_CJK = re.compile(r"[\u3000-\u303f\u3400-\u9fff\uf900-\ufaff\uff00-\uffef]")
+
+
+def estimate_tokens(text: str) -> int:
+    """粗估 token 數：中日韓字元約 1 字 1 token，其餘約 4 字元 1 token。不需載入 tokenizer。"""
+    text = text or ""
+    cjk = len(_CJK.findall(text))
+    return cjk + (len(text) - cjk + 3) // 4
+
+
+def extract_json(text: str):
+    """從模型回覆中取出第一段 JSON（容許前後有說明文字或 ```json 區塊）；失敗回傳 None。"""
+    text = (text or "").strip()
+    # 先試較早出現的開頭符號：`[{...}]` 是清單，不該被當成從第一個 { 開始的物件
+    pairs = sorted((("{", "}"), ("[", "]")), key=lambda pair: (text.find(pair[0]) == -1, text.find(pair[0])))
+    for opener, closer in pairs:
+        start, end = text.find(opener), text.rfind(closer)
+        if start != -1 and end > start:
+            try:
+                return json.loads(text[start:end + 1])
+            except ValueError:
+                continue
+    return None
+
+
+# =========================================================
+# ⏱ 節流：token bucket + 429 自適應降速 + Retry-After / 指數退避
+# =========================================================
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+def _status_of(exc):
+    status = getattr(exc, "status_code", None)
+    if status is None:
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+    return status
+
+
+def _is_transport_error(exc) -> bool:
+    """連線失敗 / 逾時（沒有 HTTP 狀態碼）；APITimeoutError 是 APIConnectionError 的子類別。"""
+    if isinstance(exc, (ConnectionError, TimeoutError)):
+        return True
+    return _status_of(exc) is None and isinstance(exc, openai.APIConnectionError)
+
+
+def _retry_after(exc):
+    """從例外附帶的 response 讀 Retry-After（秒數或 HTTP 日期）；沒有則回傳 None。"""
+    headers = getattr(getattr(exc, "response", None), "headers", None) or {}
+    value = headers.get("retry-after") or headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+
+class RateLimiter:
+    """
+    所有 chat.completions.create 共用的節流器（執行緒安全）。
+
+    - token bucket：平均 rate 次/秒，最多連發 burst 次
+    - 遇到 429 時速率減半（下限 min_rate），之後每次成功加回 max_rate 的 5%，逼近供應商實際上限
+    - 可重試的錯誤依 Retry-After 等待，沒有則用帶抖動的指數退避
+    - 兩種錯誤各有重試次數：429 / 5xx 用 max_retries（RATE_MAX_RETRIES）；
+      連線失敗 / 逾時用 call() 的 transport_retries，wrap() 時取自 client 原本的 max_retries（LLM_MAX_RETRIES）。
+      SDK 自身的重試會關閉，所有重試都在這裡進行、都經過節流
+    """
+
+    def __init__(self, per_sec: float = 2.0, burst: int = 4, max_retries: int = 4,
+                 backoff_base: float = 1.0, backoff_max: float = 30.0, min_rate: float = 0.1):
+        self.max_rate = per_sec
+        self.min_rate = min(min_rate, per_sec)
+        self.rate = per_sec
+        self.burst = max(1, burst)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.throttled = 0          # 收到 429 的次數
+        self.retries = 0
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._recent = deque()      # 最近 60 秒送出的請求時間
+        self._lock = threading.Lock()
+        self._clients = {}
+
+    def acquire(self):
+        """取得一個 token；不足時睡到補滿為止。"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    self._recent.append(now)
+                    return
+                wait_for = (1 - self._tokens) / self.rate
+            time.sleep(wait_for)
+
+    def _on_success(self):
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + 0.05 * self.max_rate)
+
+    def _on_throttled(self):
+        with self._lock:
+            self.throttled += 1
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._tokens = min(self._tokens, 0.0)
+
+    def call(self, fn, *args, transport_retries: int = 0, **kwargs):
+        """
+        在節流下執行 fn；可重試的錯誤用完重試次數後原樣拋出。
+        429 / 5xx 最多重試 max_retries 次，連線失敗 / 逾時最多重試 transport_retries 次，兩者退避方式相同。
+        """
+        status_tries = transport_tries = 0
+        while True:
+            self.acquire()
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as e:
+                status = _status_of(e)
+                if status in RETRY_STATUS and status_tries < self.max_retries:
+                    status_tries += 1
+                    attempt = status_tries
+                    if status == 429:
+                        self._on_throttled()
+                elif _is_transport_error(e) and transport_tries < transport_retries:
+                    transport_tries += 1
+                    attempt = transport_tries
+                else:
+                    raise
+                with self._lock:
+                    self.retries += 1
+                delay = _retry_after(e)
+                if delay is None:
+                    delay = self.backoff_base * (2 ** (attempt - 1)) * random.uniform(0.5, 1.5)
+                time.sleep(min(delay, self.backoff_max))
+                continue
+            self._on_success()
+            return result
+
+    def wrap(self, client):
+        """
+        回傳介面相同（client.chat.completions.create）但經過節流的 client。
+        SDK 自身的重試關閉，改由本節流器處理；client 原本的 max_retries 沿用為連線失敗 / 逾時的重試次數。
+        """
+        with self._lock:
+            entry = self._clients.get(id(client))
+            if entry is None:
+                transport_retries = int(getattr(client, "max_retries", 0) or 0)
+                entry = (client, RateLimitedClient(client.with_options(max_retries=0), self, transport_retries))
+                self._clients[id(client)] = entry
+            return entry[1]
+
+    def stats(self) -> dict:
+        with self._lock:
+            now = time.monotonic()
+            while self._recent and now - self._recent[0] > 60:
+                self._recent.popleft()
+            return {
+                "rps": len(self._recent) / 60.0,   # 固定以完整 60 秒計算，與說明文字「近 60 秒」一致
+                "rate": self.rate,
+                "max_rate": self.max_rate,
+                "throttled": self.throttled,
+                "retries": self.retries,
+            }
+
+
+def llm_rate_caption(limiter: RateLimiter) -> str:
+    """節流狀態的一行摘要，供頁面以 st.caption 顯示。"""
+    stats = limiter.stats()
+    return (
+        f"⏱ LLM 節流：近 60 秒 {stats['rps']:.2f} 次/秒，"
+        f"目前速率上限 {stats['rate']:.2f}/{stats['max_rate']:.2f} 次/秒，"
+        f"429 共 {stats['throttled']} 次、重試 {stats['retries']} 次"
+    )
+
+
+class RateLimitedClient:
+    """只包裝 chat.completions.create 的 client；其餘用法請直接使用原 client。"""
+
+    def __init__(self, client, limiter: RateLimiter, transport_retries: int = 0):
+        self._client = client
+        self._limiter = limiter
+        self._transport_retries = transport_retries
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    def _create(self, **kwargs):
+        return self._limiter.call(self._client.chat.completions.create,
+                                  transport_retries=self._transport_retries, **kwargs)
+
+
+@st.cache_resource(show_spinner=False)
+def get_rate_limiter(per_sec: float = 2.0, burst: int = 4, max_retries: int = 4,
+                     backoff_base: float = 1.0, backoff_max: float = 30.0) -> RateLimiter:
+    """行程共用的 LLM 節流器；參數來自 secrets 的 RATE_* 設定。"""
+    return RateLimiter(per_sec, burst, max_retries, backoff_base, backoff_max)
+
+
+# =========================================================
+# 💬 串流回覆：逐段顯示、即時隱藏 <think>、記錄首字延遲
+# =========================================================
+THINK_OPEN, THINK_CLOSE = "<think>", "</think>"
+
+
+def strip_think(txt: str) -> str:
+    """移除 deepseek-r1 可能回傳的 <think>... 區塊"""
+    return re.sub(r"<think>.*?</think>", "", txt or "", flags=re.DOTALL).strip()
+
+
+def _partial_suffix(buf: str, tag: str) -> int:
+    """buf 結尾若是 tag 的前綴（例如 "<thi"），回傳其長度，需保留到下一段再判斷。"""
+    for k in range(min(len(tag) - 1, len(buf)), 0, -1):
+        if buf.endswith(tag[:k]):
+            return k
+    return 0
+
+
+def strip_think_stream(chunks):
+    """strip_think 的串流版：<think> 區塊即時略過，標籤被切在兩段之間也能正確處理。"""
+    buf, in_think, started = "", False, False
+    for chunk in chunks:
+        buf += chunk or ""
+        out = []
+        while buf:
+            if in_think:
+                idx = buf.find(THINK_CLOSE)
+                if idx == -1:
+                    keep = _partial_suffix(buf, THINK_CLOSE)
+                    buf = buf[len(buf) - keep:] if keep else ""
+                    break
+                buf, in_think = buf[idx + len(THINK_CLOSE):], False
+            else:
+                idx = buf.find(THINK_OPEN)
+                if idx == -1:
+                    keep = _partial_suffix(buf, THINK_OPEN)
+                    out.append(buf[:len(buf) - keep])
+                    buf = buf[len(buf) - keep:]
+                    break
+                out.append(buf[:idx])
+                buf, in_think = buf[idx + len(THINK_OPEN):], True
+        text = "".join(out)
+        if not started:
+            text = text.lstrip()
+            started = bool(text)
+        if text:
+            yield text
+    if buf and not in_think:
+        yield buf if started else buf.lstrip()
+
+
+class StreamStats:
+    """記錄一次串流回覆的首字延遲（TTFT）與總耗時；以 track() 包住最後要顯示的串流。"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.first_token = None
+        self.finished = None
+        self.chars = 0
+
+    def track(self, chunks):
+        for text in chunks:
+            if text and self.first_token is None:
+                self.first_token = time.perf_counter()
+            self.chars += len(text or "")
+            yield text
+        self.finished = time.perf_counter()
+
+    def caption(self) -> str:
+        if self.first_token is None:
+            return "⚡ 未收到任何回覆內容"
+        total = (self.finished or time.perf_counter()) - self.started
+        return f"⚡ 首字 {self.first_token - self.started:.2f} 秒，完成 {total:.1f} 秒，共 {self.chars} 字"
+
+
+def stream_chat(client, **kwargs):
+    """以 stream=True 呼叫 chat.completions.create，逐段 yield 文字；可直接交給 st.write_stream。"""
+    stream = client.chat.completions.create(stream=True, **kwargs)
+    for event in stream:
+        if not event.choices:
+            continue
+        text = getattr(event.choices[0].delta, "content", None)
+        if text:
+            yield text
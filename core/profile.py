@@ -0,0 +1,150 @@
+"""
+給 GPT 分析用的資料集摘要：在固定 token 預算內描述「整份」資料，而不是只貼前幾列。
+
+依優先順序放入，超過預算就停（欄位統計最多占 60%、相關係數到 70%，其餘留給抽樣列，
+寬表才不會整份預算都花在欄位清單上）：
+1. 規模與欄位結構（型別、缺值比例）+ 每欄統計（數值：min / 平均 / 中位數 / max；
+   日期：範圍；文字 / 分類：相異值數與前幾名占比）
+2. 數值欄之間相關係數最強的幾組
+3. 依低基數分類欄分層抽樣的資料列（各組輪流取，盡量填滿剩餘預算）
+"""
+import numpy as np
+import streamlit as st
+
+from core.lazy import lazy_import
+from core.llm import estimate_tokens
+
+pd = lazy_import("pandas")
+
+PROFILE_TOKENS = 1500       # 摘要的 token 上限
+TOP_CATEGORIES = 3          # 文字 / 分類欄列出前幾名
+MAX_CORRELATIONS = 5
+MIN_CORRELATION = 0.3       # |r| 低於此值不列出
+MAX_CORR_COLUMNS = 30       # 相關矩陣最多取幾個數值欄，避免寬表 O(欄數²)
+COLUMNS_SHARE = 0.6         # 欄位統計最多占預算比例
+CORR_SHARE = 0.7            # 欄位統計 + 相關係數最多占預算比例
+MAX_SAMPLE_ROWS = 30
+MAX_SAMPLE_COLUMNS = 12     # 寬表的抽樣列只放前幾欄
+CELL_CHARS = 40             # 抽樣列每格最多字元
+
+
+def _fmt(value) -> str:
+    if isinstance(value, float):
+        return f"{value:,.6g}"
+    if isinstance(value, pd.Timestamp):
+        return value.strftime("%Y-%m-%d") if value == value.normalize() else str(value)
+    return str(value)
+
+
+def _column_line(name: str, series) -> str:
+    missing = series.isna().mean() if len(series) else 0
+    head = f"- {name}（{series.dtype}" + (f"，缺值 {missing:.0%}）" if missing else "）")
+    valid = series.dropna()
+    if valid.empty:
+        return head + "：全為缺值"
+    if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+        values = valid.to_numpy(dtype=float)
+        return head + "：min {} / 平均 {} / 中位數 {} / max {}".format(
+            *(_fmt(float(v)) for v in (values.min(), values.mean(), np.median(values), values.max())))
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return head + f"：{_fmt(valid.min())} ~ {_fmt(valid.max())}"
+    counts = valid.value_counts(normalize=True)
+    top = "、".join(f"{str(v)[:CELL_CHARS]}({p:.0%})" for v, p in counts.head(TOP_CATEGORIES).items())
+    return head + f"：相異值 {int((counts > 0).sum()):,}；前幾名 {top}"
+
+
+def _correlation_lines(df) -> list:
+    numeric = df.select_dtypes(include="number").iloc[:, :MAX_CORR_COLUMNS]
+    if numeric.shape[1] < 2:
+        return []
+    corr = numeric.corr().to_numpy()
+    names = numeric.columns
+    upper = np.triu_indices_from(corr, k=1)
+    strength = np.nan_to_num(np.abs(corr[upper]))
+    order = np.argsort(-strength)[:MAX_CORRELATIONS]
+    return [f"- {names[upper[0][i]]} ↔ {names[upper[1][i]]}：r = {corr[upper][i]:+.2f}"
+            for i in order if strength[i] >= MIN_CORRELATION]
+
+
+def _strata_column(df):
+    """挑相異值 2~20 個、最少的文字 / 分類欄作為分層依據；沒有則回傳 None。"""
+    best = None
+    for name in df.select_dtypes(exclude=["number", "datetime"]).columns:
+        k = df[name].nunique()
+        if 2 <= k <= 20 and (best is None or k < best[1]):
+            best = (name, k)
+    return best[0] if best else None
+
+
+def stratified_sample(df, n: int = MAX_SAMPLE_ROWS, seed: int = 0):
+    """各組（依 _strata_column）輪流各取一列，直到 n 列；沒有可分層的欄就整體隨機抽。"""
+    if len(df) <= n:
+        return df
+    strata = _strata_column(df)
+    if strata is None:
+        return df.sample(n, random_state=seed)
+    shuffled = df.sample(min(len(df), n * 50), random_state=seed)
+    rank = shuffled.groupby(strata, observed=True, sort=False).cumcount()
+    return shuffled.iloc[np.argsort(rank.to_numpy(), kind="stable")[:n]]
+
+
+def _sample_lines(sample) -> list:
+    columns = list(sample.columns[:MAX_SAMPLE_COLUMNS])
+    rows = [["" if pd.isna(v) else _fmt(v)[:CELL_CHARS] for v in row]
+            for row in sample[columns].itertuples(index=False)]
+    header = ["| " + " | ".join(map(str, columns)) + " |", "|" + "---|" * len(columns)]
+    return header + ["| " + " | ".join(r) + " |" for r in rows]
+
+
+def build_profile(df, budget_tokens: int = PROFILE_TOKENS):
+    """回傳 (摘要文字, info)；info: {"tokens", "columns", "sample_rows"}。"""
+    lines, used = [], 0
+
+    def add(line: str, share: float = 1.0) -> bool:
+        nonlocal used
+        cost = estimate_tokens(line) + 1
+        if used + cost > budget_tokens * share:
+            return False
+        lines.append(line)
+        used += cost
+        return True
+
+    add(f"資料規模：{len(df):,} 列 × {df.shape[1]} 欄")
+    add("欄位與統計：")
+    listed = 0
+    for name in df.columns:
+        if not add(_column_line(name, df[name]), COLUMNS_SHARE):
+            add(f"…另有 {df.shape[1] - listed} 欄未列出")
+            break
+        listed += 1
+
+    corr_lines = _correlation_lines(df)
+    if corr_lines and add("數值欄相關係數（|r| 最大者）：", CORR_SHARE):
+        for line in corr_lines:
+            if not add(line, CORR_SHARE):
+                break
+
+    sampled = 0
+    sample_lines = _sample_lines(stratified_sample(df))
+    head = ["分層抽樣資料列："] + sample_lines[:3]      # 標題 + 表頭 + 至少一列放得下才加
+    if len(sample_lines) > 2 and used + sum(estimate_tokens(line) + 1 for line in head) <= budget_tokens:
+        for line in head[:3]:
+            add(line)
+        for line in sample_lines[2:]:
+            if not add(line):
+                break
+            sampled += 1
+    if df.shape[1] > MAX_SAMPLE_COLUMNS and sampled:
+        add(f"（抽樣列僅顯示前 {MAX_SAMPLE_COLUMNS} 欄）")
+    return "\n".join(lines), {"tokens": used, "columns": listed, "sample_rows": sampled}
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def get_profile(dataset_key: str, budget_tokens: int, _df):
+    """同一份資料（dataset_key）同一預算只建一次摘要。"""
+    return build_profile(_df, budget_tokens)
+
+
+def profile_caption(info: dict) -> str:
+    return (f"🧾 資料摘要約 {info['tokens']:,} tokens：{info['columns']} 欄統計、"
+            f"{info['sample_rows']} 列分層抽樣")
@@ -0,0 +1,121 @@
+"""
+LLM 回覆的持久化快取（SQLite）。
+
+同樣的 (模型, 正規化後的 messages, temperature, max_tokens) 直接回放上次的回覆，
+不再送到 OpenRouter；rerun、重新整理或同事問同一題都能命中。
+項目超過 ttl 秒即失效，超過 max_entries 時依最近使用時間淘汰（LRU）。
+"""
+import hashlib
+import json
+import os
+import re
+import time
+
+import streamlit as st
+
+from core.llm import stream_chat
+from core.sqlite_lru import SqliteLRU
+
+DEFAULT_PATH = os.path.join(".cache", "llm_replies.sqlite3")
+DEFAULT_MAX_ENTRIES = 2000
+DEFAULT_TTL = 86400.0
+
+_SPACES = re.compile(r"[ \t　]+")
+
+
+def normalize_messages(messages: list) -> list:
+    """去掉每行首尾空白、合併連續空白與空行，排版差異不影響快取鍵。"""
+    normalized = []
+    for message in messages:
+        lines = [_SPACES.sub(" ", line).strip() for line in str(message.get("content", "")).splitlines()]
+        normalized.append({"role": message.get("role", "user"), "content": "\n".join(l for l in lines if l)})
+    return normalized
+
+
+def request_key(model: str, messages: list, temperature=None, max_tokens=None) -> str:
+    payload = json.dumps(
+        [model, normalize_messages(messages), temperature, max_tokens],
+        ensure_ascii=False, sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ReplyCache(SqliteLRU):
+    TABLE = "replies"
+    COLUMNS = """key TEXT PRIMARY KEY,
+                 model TEXT NOT NULL,
+                 reply TEXT NOT NULL,
+                 latency REAL NOT NULL,
+                 created REAL NOT NULL,
+                 last_used REAL NOT NULL"""
+    KEY_COLUMNS = ("key",)
+
+    def __init__(self, path: str = DEFAULT_PATH, max_entries: int = DEFAULT_MAX_ENTRIES, ttl: float = DEFAULT_TTL):
+        super().__init__(path, max_entries)
+        self.ttl = ttl
+        self.saved_seconds = 0.0
+
+    def get(self, key: str):
+        """回傳 (回覆, 當初耗時秒數)；不存在或已過期回傳 None（過期項目順便刪除）。"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT reply, latency, created FROM replies WHERE key=?", (key,)).fetchone()
+            if row and now - row[2] > self.ttl:
+                self._conn.execute("DELETE FROM replies WHERE key=?", (key,))
+                self._conn.commit()
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            self._touch([(key,)])
+            self.hits += 1
+            self.saved_seconds += row[1]
+        return row[0], row[1]
+
+    def put(self, key: str, model: str, reply: str, latency: float):
+        """寫入一筆回覆，並在超過容量時淘汰最久未使用的項目。"""
+        now = time.time()
+        self._insert([(key, model, reply, latency, now, now)])
+
+    def stream(self, client, *, bypass: bool = False, status: dict = None, **kwargs):
+        """
+        stream_chat 的快取版：命中時一次 yield 整段回覆；未命中（或 bypass）時照常串流，
+        完整收完才寫入快取（中途中斷不會留下半段回覆）。status 會填入 {"hit", "latency"}。
+        """
+        status = status if status is not None else {}
+        key = request_key(kwargs.get("model"), kwargs.get("messages", []),
+                          kwargs.get("temperature"), kwargs.get("max_tokens"))
+        cached = None if bypass else self.get(key)
+        if cached is not None:
+            status.update(hit=True, latency=cached[1])
+            yield cached[0]
+            return
+        status.update(hit=False, latency=None)
+        started = time.perf_counter()
+        parts = []
+        for text in stream_chat(client, **kwargs):
+            parts.append(text)
+            yield text
+        status["latency"] = time.perf_counter() - started
+        if parts:
+            self.put(key, kwargs.get("model") or "", "".join(parts), status["latency"])
+
+    def stats(self) -> dict:
+        return {**super().stats(), "saved_seconds": self.saved_seconds}
+
+    def caption(self, status: dict = None) -> str:
+        s = self.stats()
+        head = ""
+        if status and status.get("hit"):
+            head = f"本次命中（省下約 {status['latency']:.1f} 秒）｜"
+        elif status:
+            head = "本次未命中｜"
+        return (f"💾 回覆快取：{head}累計命中 {s['hits']} / 未命中 {s['misses']}"
+                f"（{s['hit_rate']:.0%}），共省下 {s['saved_seconds']:.1f} 秒，"
+                f"{s['entries']}/{s['max_entries']} 筆")
+
+
+@st.cache_resource(show_spinner=False)
+def get_reply_cache(path: str = DEFAULT_PATH, max_entries: int = DEFAULT_MAX_ENTRIES, ttl: float = DEFAULT_TTL) -> ReplyCache:
+    """行程共用的回覆快取；命中 / 未命中次數從行程啟動起累計。"""
+    return ReplyCache(path, max_entries, ttl)
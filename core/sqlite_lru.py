@@ -0,0 +1,69 @@
+"""
+SQLite 上的 LRU 快取表（議題快取、回覆快取共用）。
+
+負責連線設定（WAL、跨執行緒共用一條連線並以 lock 保護）、建表與 last_used 索引、
+寫入後依最近使用時間淘汰超出 max_entries 的項目，以及命中 / 未命中計數與 stats()。
+子類別以 TABLE、COLUMNS、KEY_COLUMNS 描述自己的表，並提供各自的查詢介面。
+"""
+import os
+import sqlite3
+import threading
+import time
+
+
+class SqliteLRU:
+    TABLE = ""
+    COLUMNS = ""             # CREATE TABLE 的欄位定義，必須包含 last_used REAL NOT NULL
+    KEY_COLUMNS = ()         # 組成主鍵的欄位，_touch 依此更新 last_used
+
+    def __init__(self, path: str, max_entries: int):
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(f"CREATE TABLE IF NOT EXISTS {self.TABLE} ({self.COLUMNS})")
+        self._conn.execute(f"CREATE INDEX IF NOT EXISTS {self.TABLE}_last_used ON {self.TABLE} (last_used)")
+        self._conn.commit()
+
+    def _touch(self, keys: list):
+        """更新命中項目的 last_used（呼叫端需持有 _lock）；keys 為 KEY_COLUMNS 順序的 tuple。"""
+        where = " AND ".join(f"{column}=?" for column in self.KEY_COLUMNS)
+        now = time.time()
+        self._conn.executemany(f"UPDATE {self.TABLE} SET last_used=? WHERE {where}", [(now, *key) for key in keys])
+        self._conn.commit()
+
+    def _insert(self, rows: list):
+        """INSERT OR REPLACE 多列（各列依表格欄位順序），並在超過容量時淘汰最久未使用的項目。"""
+        if not rows:
+            return
+        placeholders = ", ".join("?" * len(rows[0]))
+        with self._lock:
+            self._conn.executemany(f"INSERT OR REPLACE INTO {self.TABLE} VALUES ({placeholders})", rows)
+            overflow = self._count() - self.max_entries
+            if overflow > 0:
+                self._conn.execute(
+                    f"DELETE FROM {self.TABLE} WHERE rowid IN "
+                    f"(SELECT rowid FROM {self.TABLE} ORDER BY last_used LIMIT ?)",
+                    (overflow,),
+                )
+            self._conn.commit()
+
+    def _count(self) -> int:
+        return self._conn.execute(f"SELECT COUNT(*) FROM {self.TABLE}").fetchone()[0]
+
+    def stats(self) -> dict:
+        with self._lock:
+            entries = self._count()
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": entries,
+            "max_entries": self.max_entries,
+        }
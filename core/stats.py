@@ -0,0 +1,94 @@
+"""
+上傳資料的統計摘要（describe）：每份資料只算一次，大資料改用近似值。
+
+- 精確模式：直接呼叫 DataFrame.describe；
+- 近似模式：count / mean / std / min / max / unique 仍為精確值（皆為單次向量化掃描），
+  真正昂貴的分位數（排序 / partition）與文字欄 top / freq（整欄 value_counts）改取自等距抽樣。
+
+相異值數沒有用 HyperLogLog：實測 pandas 的 nunique（C 雜湊表）比先對整欄算 64-bit hash 再估計還快。
+"""
+import numpy as np
+import streamlit as st
+
+from core.lazy import lazy_import
+
+pd = lazy_import("pandas")
+
+APPROX_MIN_ROWS = 200_000   # 超過此列數預設用近似模式
+SAMPLE_ROWS = 100_000       # 分位數抽樣大小：排名誤差約 1/sqrt(n) ≈ 0.3%
+PERCENTILES = (0.25, 0.5, 0.75)
+STAT_ROWS = ["count", "unique", "top", "freq", "mean", "std", "min", "25%", "50%", "75%", "max"]
+
+
+def _sample(series, n: int):
+    """等距抽樣約 n 筆：只需切片、不必產生亂數排列；對已依日期排序的資料即為系統抽樣。"""
+    return series if len(series) <= n else series.iloc[::-(-len(series) // n)]
+
+
+def _approx_column(series, sample_rows: int) -> dict:
+    valid = series.dropna()
+    stats = {"count": float(len(valid))}
+    if len(valid) == 0:
+        return stats
+    if pd.api.types.is_bool_dtype(series) or not (
+        pd.api.types.is_numeric_dtype(series) or pd.api.types.is_datetime64_any_dtype(series)
+    ):
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            counts = valid.value_counts()      # 以 codes 計數，本來就便宜，直接精確
+            stats["unique"] = int((counts > 0).sum())
+            stats["top"], stats["freq"] = counts.index[0], int(counts.iloc[0])
+        else:
+            counts = _sample(valid, sample_rows).value_counts()
+            stats["unique"] = int(valid.nunique())
+            stats["top"] = counts.index[0]
+            stats["freq"] = int(round(counts.iloc[0] * len(valid) / counts.sum()))
+        return stats
+    if pd.api.types.is_numeric_dtype(series):
+        values = valid.to_numpy(dtype=float)
+        stats["mean"], stats["std"] = values.mean(), values.std(ddof=1) if len(values) > 1 else np.nan
+    else:
+        stats["mean"] = valid.mean()
+    stats["min"], stats["max"] = valid.min(), valid.max()
+    quantiles = _sample(valid, sample_rows).quantile(list(PERCENTILES))
+    for q, value in zip(PERCENTILES, quantiles):
+        stats[f"{q:.0%}"] = value
+    return stats
+
+
+def describe_frame(df, include_all: bool = False, exact: bool = None, sample_rows: int = SAMPLE_ROWS):
+    """
+    回傳 (統計表, info)。統計表格式同 DataFrame.describe（列為統計量、欄為原欄位）。
+    include_all=False 時只統計數值欄；exact=None 依列數自動決定。info: {"exact", "rows", "sample"}。
+    """
+    if exact is None:
+        exact = len(df) < APPROX_MIN_ROWS
+    columns = df if include_all else df.select_dtypes(include="number")
+    info = {"exact": exact, "rows": len(df), "sample": min(len(df), sample_rows)}
+    if columns.shape[1] == 0:
+        return pd.DataFrame(), info
+    if exact:
+        return columns.describe(include="all") if include_all else columns.describe(), info
+    table = pd.DataFrame({name: _approx_column(columns[name], sample_rows) for name in columns.columns})
+    return table.reindex([row for row in STAT_ROWS if row in table.index]), info
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def get_describe(dataset_key: str, include_all: bool, exact: bool, _df):
+    """同一份資料（dataset_key）同一組參數只統計一次。"""
+    return describe_frame(_df, include_all=include_all, exact=exact)
+
+
+def display_stats(table):
+    """混合型別的欄（例如同時有數字與日期）轉成文字，避免轉 Arrow 時失敗；數值欄維持原型別。"""
+    table = table.copy()
+    for name in table.columns:
+        if table[name].dtype == object:
+            table[name] = table[name].map(lambda v: "" if pd.isna(v) else str(v))
+    return table
+
+
+def stats_caption(info: dict) -> str:
+    if info["exact"]:
+        return f"📐 精確統計（{info['rows']:,} 列）"
+    return (f"📐 近似統計：分位數與 top / freq 取自 {info['sample']:,} / {info['rows']:,} 列等距抽樣，"
+            f"其餘為精確值")
@@ -0,0 +1,76 @@
+"""
+局部重跑（st.fragment）與伺服器耗時量測。
+
+獨立區塊（不影響頁面其他部分的 widget）包成 fragment 後，操作該區塊的 widget 只重跑這一段，
+不再重跑整份 app.py（CSS、側欄選單、其他區塊、上游資料載入）。
+每次整頁執行與每次 fragment 執行的耗時都記在 st.session_state：
+- 頁尾顯示最近一次整頁執行（含當次各區塊）的耗時；
+- fragment 單獨重跑時不會執行到頁尾，因此每個 fragment 在區塊底部顯示自己這次的耗時，
+  並與最近一次整頁執行相比，局部重跑省下的時間直接可見。
+"""
+import functools
+import time
+
+import streamlit as st
+
+TIMINGS_KEY = "_run_timings"
+LAST_PAGE_KEY = "_last_page_run"   # 最近一次完成的整頁執行秒數；不隨下一次整頁執行清除
+PAGE_RUN = "整頁"
+
+
+def _record(name: str, seconds: float):
+    st.session_state.setdefault(TIMINGS_KEY, {})[name] = seconds
+
+
+def start_page_timer():
+    """放在 app.py 最上方：記錄本次整頁執行的起點，並清掉上一頁留下的區塊紀錄。"""
+    st.session_state[TIMINGS_KEY] = {}
+    st.session_state["_page_started"] = time.perf_counter()
+
+
+def finish_page_timer():
+    """放在 app.py 最下方：記錄整頁執行耗時（fragment 單獨重跑時不會執行到這裡）。"""
+    started = st.session_state.get("_page_started")
+    if started is not None:
+        elapsed = time.perf_counter() - started
+        _record(PAGE_RUN, elapsed)
+        st.session_state[LAST_PAGE_KEY] = elapsed
+
+
+def timed_fragment(name: str, run_every=None, caption: bool = True):
+    """
+    st.fragment 的包裝：記錄這個區塊每次執行的耗時（以 name 區分）；
+    caption=True 時在區塊底部顯示本次耗時（區塊正常跑完才顯示，st.rerun / st.stop 中斷時不顯示）。
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                result = func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - started
+                _record(name, elapsed)
+            if caption:
+                st.caption(fragment_caption(name, elapsed))
+            return result
+        return st.fragment(timed, run_every=run_every)
+    return decorator
+
+
+def fragment_caption(name: str, seconds: float) -> str:
+    """例：「⏱ 圖表視覺化 35 ms（整頁執行 812 ms）」；尚無整頁紀錄時只顯示區塊耗時。"""
+    text = f"⏱ {name} {seconds * 1000:,.0f} ms"
+    page = st.session_state.get(LAST_PAGE_KEY)
+    if page:
+        text += f"（整頁執行 {page * 1000:,.0f} ms）"
+    return text
+
+
+def timing_caption() -> str:
+    """例：「⏱ 伺服器耗時：整頁 812 ms｜圖表視覺化 35 ms」；尚無紀錄時回傳空字串。"""
+    timings = st.session_state.get(TIMINGS_KEY) or {}
+    if not timings:
+        return ""
+    ordered = sorted(timings.items(), key=lambda item: item[0] != PAGE_RUN)
+    return "⏱ 伺服器耗時：" + "｜".join(f"{name} {seconds * 1000:,.0f} ms" for name, seconds in ordered)
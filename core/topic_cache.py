@@ -0,0 +1,63 @@
+"""
+議題分類的持久化快取（SQLite）。
+
+同一篇新聞的議題不會變，以 (網址, 內文雜湊, 模型, prompt 版本) 為鍵保存 LLM 結果，
+跨使用者、跨搜尋、跨重啟共用；超過 max_entries 時依最近使用時間淘汰（LRU）。
+"""
+import hashlib
+import os
+import time
+
+import streamlit as st
+
+from core.sqlite_lru import SqliteLRU
+
+DEFAULT_PATH = os.path.join(".cache", "topics.sqlite3")
+DEFAULT_MAX_ENTRIES = 20000
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha1((text or "").encode("utf-8")).hexdigest()
+
+
+class TopicCache(SqliteLRU):
+    TABLE = "topics"
+    COLUMNS = """url TEXT NOT NULL,
+                 content_hash TEXT NOT NULL,
+                 model TEXT NOT NULL,
+                 prompt_version TEXT NOT NULL,
+                 topic TEXT NOT NULL,
+                 last_used REAL NOT NULL,
+                 PRIMARY KEY (url, content_hash, model, prompt_version)"""
+    KEY_COLUMNS = ("url", "content_hash", "model", "prompt_version")
+
+    def __init__(self, path: str = DEFAULT_PATH, max_entries: int = DEFAULT_MAX_ENTRIES):
+        super().__init__(path, max_entries)
+
+    def get_many(self, keys: list) -> dict:
+        """keys 為 (url, content_hash, model, prompt_version) 清單；回傳命中的 {key: topic}。"""
+        found = {}
+        with self._lock:
+            for key in set(keys):
+                row = self._conn.execute(
+                    "SELECT topic FROM topics WHERE url=? AND content_hash=? AND model=? AND prompt_version=?",
+                    key,
+                ).fetchone()
+                if row:
+                    found[key] = row[0]
+            if found:
+                self._touch(list(found))
+            self.hits += sum(1 for key in keys if key in found)
+            self.misses += sum(1 for key in keys if key not in found)
+        return found
+
+    def put_many(self, items: dict):
+        """寫入 {key: topic}，並在超過容量時淘汰最久未使用的項目。"""
+        now = time.time()
+        self._insert([(*key, topic, now) for key, topic in items.items()])
+
+
+@st.cache_resource(show_spinner=False)
+def get_topic_cache(path: str = DEFAULT_PATH, max_entries: int = DEFAULT_MAX_ENTRIES) -> TopicCache:
+    """行程共用的議題快取；命中 / 未命中次數從行程啟動起累計。"""
+    return TopicCache(path, max_entries)
@@ -0,0 +1,159 @@
+"""
+新聞議題分類（LLM）：一次送出多則新聞、以 JSON 取回各則議題，解析失敗的列才逐則補呼叫
+（請求本身失敗時整批標為分類失敗，不逐則重送）。
+"""
+import hashlib
+
+from core.llm import estimate_tokens, extract_json
+from core.topic_cache import content_hash
+
+TOPIC_MODEL = "deepseek/deepseek-chat"
+SNIPPET_CHARS = 300          # 批次模式每則內文只取前段，單則補呼叫維持 500 字
+MAX_BATCH_ITEMS = 20
+MAX_BATCH_TOKENS = 3000      # 單次請求的輸入 token 上限（粗估）
+# 輸出 token 預算：模型常會縮排排版或包上 ```json，每則預留 32 token，外框另留 40，避免 JSON 被截斷
+REPLY_TOKENS_PER_ITEM = 32
+REPLY_TOKENS_BASE = 40
+
+SYSTEM_PROMPT = (
+    "你是一位新聞議題分類專家，請根據新聞標題與內文，回傳最合適的一個議題分類，"
+    "例如：科技、財經、政治、產業趨勢、國際、人物報導、消費、AI、新創、教育、健康等。"
+    "只回傳分類名稱，不需要解釋。"
+)
+BATCH_SYSTEM_PROMPT = (
+    "你是一位新聞議題分類專家，請根據每則新聞的標題與內文，各回傳最合適的一個議題分類，"
+    "例如：科技、財經、政治、產業趨勢、國際、人物報導、消費、AI、新創、教育、健康等。"
+    '只回傳 JSON，格式為 {"labels": [{"id": 編號, "topic": "分類名稱"}, ...]}，'
+    "每則新聞都要有一筆，不需要解釋。"
+)
+
+# prompt 內容變更時版本自動改變，舊的快取結果就不會再被使用
+PROMPT_VERSION = hashlib.sha1((SYSTEM_PROMPT + BATCH_SYSTEM_PROMPT).encode("utf-8")).hexdigest()[:8]
+
+
+def classify_topic(client, title: str, content: str, model: str = TOPIC_MODEL) -> str:
+    """呼叫 OpenRouter（deepseek-chat）將標題與內文分類為單一議題"""
+    try:
+        resp = client.chat.completions.create(
+            model=model,
+            messages=[
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": f"標題：{title}\n內文：{(content or '')[:500]}"},
+            ],
+            temperature=0.3,
+            max_tokens=20
+        )
+        topic = (resp.choices[0].message.content or "").strip()
+        return topic if topic else "未分類"
+    except Exception as e:
+        return f"分類失敗: {e}"
+
+
+def _item_text(idx: int, article: dict) -> str:
+    title = article.get("新聞標題", "") or ""
+    content = (article.get("新聞內容", "") or "")[:SNIPPET_CHARS].replace("\n", " ")
+    return f"[{idx}] 標題：{title}\n內文：{content}"
+
+
+def split_batches(articles: list, max_items: int = MAX_BATCH_ITEMS,
+                  max_tokens: int = MAX_BATCH_TOKENS) -> list:
+    """依筆數與粗估 token 數切批，回傳 [[(原始索引, 文字), ...], ...]。"""
+    batches, current, used = [], [], estimate_tokens(BATCH_SYSTEM_PROMPT)
+    for idx, article in enumerate(articles):
+        text = _item_text(idx, article)
+        cost = estimate_tokens(text)
+        if current and (len(current) >= max_items or used + cost > max_tokens):
+            batches.append(current)
+            current, used = [], estimate_tokens(BATCH_SYSTEM_PROMPT)
+        current.append((idx, text))
+        used += cost
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _parse_labels(raw: str, ids: set) -> dict:
+    """把模型回覆解析成 {索引: 議題}；只收編號在本批之中、議題非空的項目。"""
+    data = extract_json(raw)
+    if isinstance(data, dict):
+        data = data.get("labels", [])
+    labels = {}
+    for item in data if isinstance(data, list) else []:
+        if not isinstance(item, dict):
+            continue
+        try:
+            idx = int(item.get("id"))
+        except (TypeError, ValueError):
+            continue
+        topic = str(item.get("topic") or "").strip()
+        if idx in ids and topic:
+            labels[idx] = topic
+    return labels
+
+
+def classify_topics(client, articles: list, model: str = TOPIC_MODEL, *,
+                    cache=None, on_progress=None, stats=None) -> list:
+    """
+    批次分類多則新聞，回傳與 articles 等長的議題清單。
+
+    有 cache（TopicCache）時先查快取，只有未命中的新聞才送 LLM，結果再寫回快取。
+    每批一次請求，模型以 JSON 回傳各則議題；漏回或格式錯誤的列再用 classify_topic 逐則補上，
+    整批請求失敗時則整批標為「分類失敗」，不逐則補呼叫。
+    on_progress(done, total) 於查完快取及每批（含補呼叫）完成後回報。
+    stats（dict）若有提供，本次呼叫的快取命中數會累加到 stats["cache_hits"]；
+    cache 是行程共用的，它的 hits 計數器會混入其他工作階段，不能拿來算單次搜尋的命中數。
+    """
+    topics = [None] * len(articles)
+    keys = [
+        (a.get("新聞網址", ""), content_hash(a.get("新聞內容", "")), model, PROMPT_VERSION)
+        for a in articles
+    ]
+    if cache is not None:
+        cached = cache.get_many(keys)
+        for i, key in enumerate(keys):
+            topics[i] = cached.get(key)
+    todo = [i for i, topic in enumerate(topics) if topic is None]
+    done = len(articles) - len(todo)
+    if stats is not None:
+        stats["cache_hits"] = stats.get("cache_hits", 0) + done
+    if on_progress and done:
+        on_progress(done, len(articles))
+
+    batches = split_batches([articles[i] for i in todo])
+    for batch in batches:
+        ids = {idx for idx, _ in batch}
+        failure = None
+        try:
+            resp = client.chat.completions.create(
+                model=model,
+                messages=[
+                    {"role": "system", "content": BATCH_SYSTEM_PROMPT},
+                    {"role": "user", "content": "\n\n".join(text for _, text in batch)},
+                ],
+                temperature=0.3,
+                max_tokens=REPLY_TOKENS_BASE + REPLY_TOKENS_PER_ITEM * len(batch),
+            )
+            raw = resp.choices[0].message.content if resp.choices else ""
+            labels = _parse_labels(raw, ids)
+        except Exception as e:
+            # 請求本身失敗（網路、429 重試用盡、逾時）：端點正忙時不再逐則補呼叫加重負載，整批標為失敗（不寫入快取）
+            failure, labels = f"分類失敗: {e}", {}
+
+        fresh = {}
+        for idx in sorted(ids):
+            i = todo[idx]
+            if failure is not None:
+                topics[i] = failure
+            elif idx in labels:
+                topics[i] = labels[idx]
+            else:
+                article = articles[i]
+                topics[i] = classify_topic(client, article.get("新聞標題", ""), article.get("新聞內容", ""), model)
+            if not topics[i].startswith("分類失敗"):
+                fresh[keys[i]] = topics[i]
+        if cache is not None:
+            cache.put_many(fresh)
+        done += len(batch)
+        if on_progress:
+            on_progress(done, len(articles))
+    return topics
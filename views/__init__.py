@@ -0,0 +1,27 @@
+"""
+頁面模組：每個側欄選項一個模組，皆提供 render()。
+
+app.py 只負責頁面設定、樣式與側欄選單，再依選到的頁面呼叫 render_page()：
+- 只匯入並執行該頁的模組，其他頁面的程式碼與套件完全不載入；
+- 模組只在第一次進入該頁時匯入一次，模組層級的設定（靜態資料表、常數、字型）之後每次 rerun 直接沿用。
+
+注意：此資料夾不可命名為 pages/，否則 Streamlit 會自動產生另一套多頁導覽。
+"""
+import importlib
+
+# 側欄選項 → 模組名稱；option_menu 依此順序顯示，bench_startup.py 也依此逐頁量測。
+# 部分選項前綴為 U+2003 全形空白。
+PAGES = {
+    "📘 Streamlit": "intro",
+    "🧮 功能介紹": "features",
+    "📊 圖表介紹": "charts",
+    "💡 實例應用": "examples",
+    "  🕴 GAI 新聞摘要": "news",
+    "  📈 數據分析助手": "data_assistant",
+    "🔗 參考資料": "references",
+}
+
+
+def render_page(page: str):
+    """匯入（已匯入則直接取用）該頁模組並執行 render()。"""
+    importlib.import_module(f"{__name__}.{PAGES[page]}").render()
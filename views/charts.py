@@ -0,0 +1,259 @@
+"""
+📊 圖表介紹：以模擬的筆電銷售資料展示 matplotlib / seaborn / Plotly 各類圖表。
+"""
+import streamlit as st
+
+from core.clients import get_setting
+from core.figures import gauge_grid, matplotlib_png, plotly_figure
+from core.lazy import lazy_import
+from core.timing import timed_fragment
+
+pd = lazy_import("pandas")
+np = lazy_import("numpy")
+plt = lazy_import("matplotlib.pyplot")
+sns = lazy_import("seaborn")
+px = lazy_import("plotly.express")
+go = lazy_import("plotly.graph_objects")
+
+# 圖表清單與模擬資料皆為靜態資料：匯入本模組時建立一次，之後每次 rerun 直接沿用
+# 熱門度依序排序的圖表資料
+CHART_TABLE = pd.DataFrame([
+    ["折線圖", "plotly", "line()"],
+    ["長條圖", "plotly", "bar()"],
+    ["圓餅圖", "plotly", "Pie()"],
+    ["熱力圖", "seaborn", "heatmap()"],
+    ["雷達圖", "plotly", "Scatterpolar()"],
+    ["環形圖", "plotly", "Pie(hole=0.5)"],
+    ["面積圖", "plotly", "area()"],
+    ["瀑布圖", "plotly", "Waterfall()"],
+    ["儀表圖", "plotly", "Indicator(gauge)"],
+    ["氣泡圖", "plotly", "scatter(size=...)"],
+    ["地圖", "plotly", "scatter_mapbox()"],
+    ["漏斗圖", "plotly", "Funnel()"],
+    ["漸層圖", "matplotlib", "imshow()"]
+], columns=["圖表名稱", "使用套件", "函數"])
+
+# ✅ 只用「圖表名稱」和「使用套件」作為可篩選欄位
+FILTERABLE_COLUMNS = ["圖表名稱", "使用套件"]
+
+# 模擬資料（保留原本）
+df_nb = pd.DataFrame({
+    "型號": ["ZenBook", "Vivobook", "ROG", "TUF", "ExpertBook", "ProArt"],
+    "Q1 銷售量": [12000, 15000, 9000, 8000, 6000, 5000],
+    "Q2 銷售量": [14000, 16000, 10000, 9500, 7000, 6500],
+    "滿意度": [85, 78, 92, 80, 88, 90],
+    "服務分數": [4.2, 3.9, 4.6, 4.0, 4.5, 4.7],
+    "價格": [35000, 28000, 49000, 42000, 31000, 46000],
+    "重量": [1.1, 1.4, 2.2, 2.5, 1.2, 1.6]
+})
+
+# 地圖範例的城市座標
+map_df = pd.DataFrame({
+    "lat": [25.03, 35.68, 37.57, 22.28],
+    "lon": [121.56, 139.76, 126.98, 114.15],
+    "城市": ["Taipei", "Tokyo", "Seoul", "Hong Kong"]
+})
+
+
+def render():
+    st.header("📊 圖表展示")
+
+    filter_column = st.selectbox("📌 選擇篩選欄位", ["全部"] + FILTERABLE_COLUMNS)
+
+    if filter_column == "全部":
+        filtered_data = CHART_TABLE
+        matched_types = set(CHART_TABLE["圖表名稱"])
+    elif filter_column == "圖表名稱":
+        selected_types = st.multiselect("✅ 選擇圖表名稱", CHART_TABLE["圖表名稱"].unique().tolist(), default=[])
+        filtered_data = CHART_TABLE[CHART_TABLE["圖表名稱"].isin(selected_types)]
+        matched_types = set(selected_types)
+    else:
+        options = CHART_TABLE[filter_column].unique()
+        selected_value = st.selectbox("🔍 選擇條件值", options)
+        filtered_data = CHART_TABLE[CHART_TABLE[filter_column] == selected_value]
+        matched_types = set(filtered_data["圖表名稱"])
+
+    st.dataframe(filtered_data, use_container_width=True)
+
+    # 各圖表：僅顯示選到的類型，並包在 expander 裡
+    # 圖本身以（圖表名稱, 參數）快取（core/figures.py）：matplotlib 存 PNG、Plotly 存 Figure，
+    # 重新整理或選「全部」時只有第一次需要建圖
+    if "漸層圖" in matched_types:
+        st.caption("🎨 **漸層圖**：色彩呈現數值強度，並在格子中顯示實際數值。")
+
+        with st.expander("🧬 漸層圖（動態選欄 + 色彩強度 + 數值顯示）"):
+            # 只有本段的 widget 會影響這張圖：包成 fragment，換欄位 / 拉滑桿只重跑本段
+            @timed_fragment("漸層圖")
+            def _gradient_section():
+                selected_column = st.selectbox("請選擇要顯示強度的欄位", df_nb.columns[1:], key="gradient_column")
+            
+                min_val = float(df_nb[selected_column].min())
+                max_val = float(df_nb[selected_column].max())
+                vmin, vmax = st.slider(
+                    "調整顏色映射範圍（強度最小 / 最大值）",
+                    min_value=min_val,
+                    max_value=max_val,
+                    value=(min_val, max_val),
+                    step=(max_val - min_val) / 100
+                )
+
+                def _gradient(selected_column, vmin, vmax):
+                    fig, ax = plt.subplots(figsize=(6, 3))
+                    values = df_nb[selected_column].values
+                    grad = np.tile(values.reshape(-1, 1), (1, 10))
+                    im = ax.imshow(grad, cmap="YlOrRd", aspect="auto", vmin=vmin, vmax=vmax)
+
+                    ax.set_yticks(np.arange(len(df_nb)))
+                    ax.set_yticklabels(df_nb["型號"], fontsize=10)
+                    ax.set_xticks([])  # 隱藏 X 軸刻度
+                    ax.set_xlabel("強度分佈（模擬）", fontsize=10)
+                    ax.set_ylabel("型號", fontsize=10)
+                    ax.set_title(f"{selected_column} 強度漸層圖", fontsize=12)
+
+                    # 👉 加上數值文字（只顯示中間第 5 列）
+                    for i, val in enumerate(values):
+                        ax.text(5, i, f"{val:.1f}", ha="center", va="center",
+                                color="white" if val > (vmin + vmax) / 2 else "black", fontsize=9)
+
+                    fig.colorbar(im, ax=ax, label="強度")
+                    fig.tight_layout()
+                    return fig
+
+                # 相同 (欄位, vmin, vmax) 直接取快取的 PNG，不再重畫
+                st.image(matplotlib_png("漸層圖", (selected_column, vmin, vmax), _gradient))
+
+                with st.expander("🔧 Source Code"):
+                    st.code("""
+    for i, val in enumerate(values):
+        ax.text(5, i, f"{val:.1f}", ha="center", va="center",
+                color="white" if val > (vmin + vmax) / 2 else "black")
+                """, language="python")
+
+            _gradient_section()
+    if "熱力圖" in matched_types:
+        with st.expander("🧩 熱力圖：滿意度 vs 價格"):
+            def _heatmap():
+                fig, ax = plt.subplots()
+                heat_data = np.outer(df_nb["滿意度"], df_nb["價格"])
+                sns.heatmap(heat_data, ax=ax)
+                return fig
+
+            st.image(matplotlib_png("熱力圖", (), _heatmap))
+            with st.expander("🔧 Source Code"):
+                st.code("sns.heatmap(...)")
+
+    if "儀表圖" in matched_types:
+        with st.expander("💧 儀表圖：滿意度展示"):
+            # 所有型號放進同一張圖（layout.grid 分格），一次送出，不再每列一張 Figure
+            gauge_columns = st.slider("每列儀表數", 1, 6, 3, key="gauge_columns")
+            gauge_cap = int(get_setting("GAUGE_MAX_ITEMS", 24))
+            fig = plotly_figure("儀表圖", (gauge_columns, gauge_cap), lambda columns, cap: gauge_grid(
+                df_nb["型號"], df_nb["滿意度"], columns=columns, max_items=cap, title_suffix=" 滿意度"))
+            st.plotly_chart(fig, use_container_width=True)
+            if len(df_nb) > gauge_cap:
+                st.caption(f"僅顯示前 {gauge_cap} / {len(df_nb)} 個型號")
+            with st.expander("🔧 Source Code"):
+                st.code("""
+fig = go.Figure([
+    go.Indicator(mode="gauge+number", value=v, title={"text": f"{m} 滿意度"},
+                 gauge={"axis": {"range": [0, 100]}},
+                 domain={"row": i // columns, "column": i % columns})
+    for i, (m, v) in enumerate(zip(df_nb["型號"], df_nb["滿意度"]))
+])
+fig.update_layout(grid={"rows": rows, "columns": columns, "pattern": "independent"})""", language="python")
+
+    if "折線圖" in matched_types:
+        with st.expander("📈 折線圖：Q1 / Q2 銷售趨勢"):
+            df_line = df_nb.set_index("型號")[["Q1 銷售量", "Q2 銷售量"]]
+            st.line_chart(df_line)
+            with st.expander("🔧 Source Code"):
+                st.code("st.line_chart(df_line)")
+
+    if "長條圖" in matched_types:
+        with st.expander("📊 長條圖：Q1 銷售比較"):
+            def _bar():
+                fig, ax = plt.subplots()
+                df_nb.plot(kind="bar", x="型號", y="Q1 銷售量", ax=ax)
+                return fig
+
+            st.image(matplotlib_png("長條圖", (), _bar))
+            with st.expander("🔧 Source Code"):
+                st.code("df_nb.plot(kind='bar', x='型號', y='Q1 銷售量', ax=ax)")
+
+    if "圓餅圖" in matched_types:
+        with st.expander("🥧 圓餅圖：Q2 銷售占比"):
+            def _pie():
+                fig, ax = plt.subplots()
+                ax.pie(df_nb["Q2 銷售量"], labels=df_nb["型號"], autopct="%1.1f%%")
+                ax.axis("equal")
+                return fig
+
+            st.image(matplotlib_png("圓餅圖", (), _pie))
+            with st.expander("🔧 Source Code"):
+                st.code("ax.pie(df_nb['Q2 銷售量'], labels=df_nb['型號'], autopct='%1.1f%%')")
+
+    if "環形圖" in matched_types:
+        with st.expander("🔄 環形圖：Q2 銷售占比"):
+            fig = plotly_figure("環形圖", (), lambda: go.Figure(go.Pie(labels=df_nb["型號"], values=df_nb["Q2 銷售量"], hole=0.5)))
+            st.plotly_chart(fig)
+            with st.expander("🔧 Source Code"):
+                st.code("go.Pie(labels=..., values=..., hole=0.5)")
+
+    if "面積圖" in matched_types:
+        with st.expander("📉 面積圖：銷售趨勢比較"):
+            df_area = df_nb.set_index("型號")[["Q1 銷售量", "Q2 銷售量"]]
+            st.area_chart(df_area)
+            with st.expander("🔧 Source Code"):
+                st.code("st.area_chart(df_area)")
+
+    if "瀑布圖" in matched_types:
+        with st.expander("🧱 瀑布圖：Q1→Q2 銷售差異"):
+            fig = plotly_figure("瀑布圖", (), lambda: go.Figure(go.Waterfall(
+                x=df_nb["型號"],
+                measure=["relative"] * len(df_nb),
+                y=df_nb["Q2 銷售量"] - df_nb["Q1 銷售量"]
+            )))
+            st.plotly_chart(fig)
+            with st.expander("🔧 Source Code"):
+                st.code("go.Waterfall(...)")
+
+    if "雷達圖" in matched_types:
+        with st.expander("📍 雷達圖：型號評比"):
+            def _radar():
+                fig = go.Figure()
+                for i in range(len(df_nb)):
+                    fig.add_trace(go.Scatterpolar(
+                        r=[df_nb.loc[i, '滿意度'], df_nb.loc[i, '服務分數'], df_nb.loc[i, '價格'], df_nb.loc[i, '重量']],
+                        theta=["滿意度", "服務分數", "價格", "重量"],
+                        fill="toself",
+                        name=df_nb.loc[i, '型號']
+                    ))
+                return fig
+
+            st.plotly_chart(plotly_figure("雷達圖", (), _radar))
+            with st.expander("🔧 Source Code"):
+                st.code("go.Scatterpolar(...)")
+
+    if "漏斗圖" in matched_types:
+        with st.expander("🧭 漏斗圖：轉換流程展示"):
+            fig = plotly_figure("漏斗圖", (), lambda: go.Figure(go.Funnel(
+                y=["造訪網站", "查看商品", "加入購物車", "完成訂單"],
+                x=[3000, 2000, 1200, 800],
+                textinfo="value+percent previous"
+            )))
+            st.plotly_chart(fig)
+            with st.expander("🔧 Source Code"):
+                st.code("go.Funnel(...)")
+
+    if "氣泡圖" in matched_types:
+        with st.expander("🧩 氣泡圖：售價與重量（模擬）"):
+            fig = plotly_figure("氣泡圖", (), lambda: px.scatter(df_nb, x="價格", y="重量", size="Q2 銷售量", color="型號"))
+            st.plotly_chart(fig)
+            with st.expander("🔧 Source Code"):
+                st.code("px.scatter(..., size='Q2 銷售量')")
+
+    if "地圖" in matched_types:
+        with st.expander("⛳ 地圖：銷售地區分布（模擬）"):
+            st.map(map_df)
+            with st.expander("🔧 Source Code"):
+                st.code("st.map(map_df)")
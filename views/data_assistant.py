@@ -0,0 +1,149 @@
+"""
+📈 數據分析助手：上傳 CSV 後顯示預覽、統計摘要、彙總圖表，並把資料摘要交給 LLM 分析。
+"""
+import streamlit as st
+
+from core.aggregate import AGGREGATIONS, get_aggregate
+from core.clients import client_settings, get_openrouter_client, get_setting, openrouter_secrets
+from core.downsample import DEFAULT_MAX_POINTS, downsample, points_caption
+from core.ingest import get_frame_cache, load_uploaded_csv, memory_caption
+from core.lazy import lazy_import
+from core.llm import StreamStats, get_rate_limiter, llm_rate_caption, strip_think_stream
+from core.profile import PROFILE_TOKENS, get_profile, profile_caption
+from core.reply_cache import get_reply_cache
+from core.stats import APPROX_MIN_ROWS, display_stats, get_describe, stats_caption
+from core.timing import timed_fragment
+
+pd = lazy_import("pandas")
+px = lazy_import("plotly.express")
+
+OPENAI_MODEL = "deepseek/deepseek-r1:free"  # 若要避免 <think>，可改 "deepseek/deepseek-chat"
+
+
+def render():
+    st.header("📈 數據分析助手")
+
+    # --- 讀取 OpenRouter 設定（優先 secrets，再退環境變數/預設），Client 為行程共用單例 ---
+    openrouter = openrouter_secrets()
+    if not openrouter["api_key"]:
+        st.error("找不到 OPENROUTER_API_KEY，請在 .streamlit/secrets.toml 或環境變數設定。")
+        st.stop()
+
+    # 所有 chat.completions.create 都經過共用節流器（token bucket + 429 退避，見 core/llm.py）
+    llm_limiter = get_rate_limiter(**client_settings("RATE_"))
+    client = llm_limiter.wrap(get_openrouter_client(**openrouter, **client_settings("LLM_")))
+    reply_cache = get_reply_cache(**client_settings("REPLY_CACHE_"))   # 相同請求直接回放（磁碟 SQLite，TTL + LRU）
+
+    uploaded_file = st.file_uploader("請上傳一個 CSV 檔案", type=["csv"])
+
+    if uploaded_file:
+        # --- 讀檔：分塊讀取（只偵測一次編碼、逐塊縮小數值型別），第一塊讀完就先顯示預覽 ---
+        st.subheader("🔍 數據預覽")
+        preview_slot = st.empty()
+        load_progress = st.empty()
+
+        def _on_chunk(chunk, rows, fraction):
+            if rows == len(chunk):
+                preview_slot.dataframe(chunk.head(), use_container_width=True)
+            load_progress.progress(fraction, text=f"讀取中…已載入 {rows:,} 列")
+
+        try:
+            df, load_info = load_uploaded_csv(
+                uploaded_file,
+                get_frame_cache(int(get_setting("UPLOAD_CACHE_MB", 512))),
+                max_rows=int(get_setting("DA_MAX_ROWS", 2_000_000)),
+                max_bytes=int(get_setting("DA_MAX_MB", 1024)) * 1024 * 1024,
+                on_chunk=_on_chunk,
+            )
+        except (UnicodeDecodeError, pd.errors.ParserError) as e:
+            load_progress.empty()
+            st.error(f"無法解析這個 CSV 檔案，請確認檔案格式與編碼：{e}")
+            st.stop()
+        load_progress.empty()
+        preview_slot.dataframe(df.head(), use_container_width=True)
+        if load_info["truncated"]:
+            st.warning(f"檔案超過讀取上限，僅載入前 {load_info['rows']:,} 列進行分析。")
+        st.caption(memory_caption(load_info["memory"]))
+
+        st.subheader("📈 數據統計摘要")
+        # 每份檔案只統計一次；大檔預設以抽樣近似分位數 / top，可切回精確值
+        exact = st.toggle("精確統計", value=len(df) < APPROX_MIN_ROWS, key="da_exact")
+        summary, summary_info = get_describe(load_info["key"], True, exact, df)
+        st.dataframe(display_stats(summary), use_container_width=True)
+        st.caption(stats_caption(summary_info))
+
+        st.subheader("📊 圖表視覺化")
+        # 軸 / 圖表類型 / 彙總方式只影響這張圖：包成 fragment，切換時不重跑讀檔與統計摘要
+        @timed_fragment("圖表視覺化")
+        def _chart_section():
+            numeric_columns = df.select_dtypes(include="number").columns.tolist()
+            non_numeric_columns = df.select_dtypes(exclude="number").columns.tolist()
+
+            if numeric_columns and non_numeric_columns:
+                x_axis = st.selectbox("選擇 X 軸欄位（分類）", non_numeric_columns, key="da_x")
+                y_axis = st.selectbox("選擇 Y 軸欄位（數值）", numeric_columns, key="da_y")
+                chart_type = st.radio("選擇圖表類型", ["Bar Chart", "Line Chart"], horizontal=True, key="da_chart")
+                agg_label = st.radio("彙總方式", list(AGGREGATIONS), horizontal=True, key="da_agg")
+
+                # 先在伺服器端依 X 軸分組彙總（每份檔案每組 (x, y, 彙總) 只算一次），圖上每個分類只有一個點 / 一根長條
+                df_agg = get_aggregate(load_info["key"], x_axis, y_axis, AGGREGATIONS[agg_label], df)
+                title = f"{y_axis}（{agg_label}）by {x_axis}"
+                if chart_type == "Bar Chart":
+                    fig = px.bar(df_agg, x=x_axis, y=y_axis, title=title)
+                    points = None
+                else:
+                    # 分類極多時再以 LTTB 縮到約圖表寬度
+                    df_plot, points = downsample(df_agg, y_axis, x=x_axis, max_points=int(get_setting("CHART_MAX_POINTS", DEFAULT_MAX_POINTS)))
+                    fig = px.line(df_plot, x=x_axis, y=y_axis, title=title)
+
+                st.plotly_chart(fig, use_container_width=True)
+                st.caption(f"🧮 {len(df):,} 列 → {len(df_agg):,} 個「{x_axis}」分類")
+                if points:
+                    st.caption(points_caption(points))
+            else:
+                st.info("需同時包含分類欄位（如文字）與數值欄位，才能建立圖表。")
+
+        _chart_section()
+
+        st.subheader("🧠 使用 GPT 分析")
+        # 輸入指令、切換快取選項不需重跑上方圖表與讀檔
+        @timed_fragment("GPT 分析")
+        def _gpt_section():
+            user_query = st.text_area("請輸入你的分析指令（如：請幫我分析客戶評論、哪個產品銷售量最好?）", key="da_query")
+
+            bypass_reply_cache = st.toggle("略過回覆快取（重新生成）", key="da_bypass_cache")
+
+            if st.button("送出給 GPT 分析", key="da_btn"):
+                # 以整份資料的摘要（欄位統計、相關係數、分層抽樣列）取代前 10 列；在 token 預算內、每份檔案只建一次
+                profile, profile_info = get_profile(load_info["key"], int(get_setting("DA_PROFILE_TOKENS", PROFILE_TOKENS)), df)
+                prompt = f"""你是一位數據分析師，請根據以下資料集摘要（涵蓋整份資料）回答問題。
+
+Data:
+{profile}
+
+問題：
+{user_query}
+
+請以條列、簡潔具體的方式回覆，必要時給出重點洞察與可能的下一步分析建議。"""
+
+                # 串流顯示分析結果，<think> 推理區塊在串流中即時略過
+                st.markdown("#### 🧾 分析結果")
+                st.caption(profile_caption(profile_info))
+                stream_stats = StreamStats()
+                reply_status = {}
+                try:
+                    st.write_stream(stream_stats.track(strip_think_stream(reply_cache.stream(
+                        client,
+                        bypass=bypass_reply_cache,
+                        status=reply_status,
+                        model=OPENAI_MODEL,
+                        messages=[{"role": "user", "content": prompt}],
+                        temperature=0.5
+                    ))))
+                    st.caption(stream_stats.caption())
+                    st.caption(reply_cache.caption(reply_status))
+                except Exception as e:
+                    st.error(f"發生錯誤：{e}")
+                st.caption(llm_rate_caption(llm_limiter))
+
+        _gpt_section()
@@ -0,0 +1,9 @@
+"""
+💡 實例應用：內容整理中。
+"""
+import streamlit as st
+
+
+def render():
+    st.header("💡 實例應用")
+    st.info("實例應用內容整理中，敬請期待。")
@@ -0,0 +1,532 @@
+"""
+🧮 功能介紹：各種輸入元件的示範與原始碼，以及上傳 Excel 後的統計、篩選與圖表。
+"""
+import time
+from datetime import datetime
+
+import streamlit as st
+
+from core.clients import get_setting
+from core.downsample import DEFAULT_MAX_POINTS, downsample, points_caption
+from core.indexes import date_bounds, date_slice_bounds, get_group_index
+from core.ingest import get_frame_cache, load_uploaded_frame, memory_caption
+from core.lazy import lazy_import
+from core.stats import APPROX_MIN_ROWS, get_describe, stats_caption
+
+pd = lazy_import("pandas")
+
+# 功能總表與分類：靜態資料，匯入本模組時建立一次，之後每次 rerun 直接沿用
+FEATURE_TABLE = pd.DataFrame([
+    ["超連結按鈕", "link_button()", "導入超連結"],
+    ["下載按鈕", "download_button()", "下載檔案功能"],
+    ["勾選按鈕", "checkbox()", "勾選按鈕功能"],
+    ["下拉式清單", "selectbox()", "下拉式選單"],
+    ["單選按鈕", "radio()", "單選按鈕功能"],
+    ["多行文字輸入", "text_area()", "輸入多行文字資料"],
+    ["單行文字輸入", "text_input()", "輸入單行文字資料"],
+    ["數字輸入", "number_input()", "輸入數值型態資料"],
+    ["日期輸入", "date_input()", "輸入日期型態資料"],
+    ["時間輸入", "time_input()", "輸入時間型態資料"],
+    ["填寫表單範例", "form()", "應用各項輸入型態資料，製作表單範例"],
+    ["BMI計算器", "slider()", "應用slider與輸入數值型態資料，計算BMI"],
+    ["進度條", "progress()", "以進度條顯示資料處理狀態"],
+    ["進度流程清單", "status()", "以清單顯示資料處理狀態"],
+    ["跳板通知", "toast()", "以跳板通知提醒資料處理狀態"],
+    ["使用指南", "expander()", "收納條列式資料"],
+    ["Excel檔案上傳", "file_uploader()", "上傳本地端資料"],
+    ["顯示統計資料", "df.describe()", "顯示基本統計資料"],
+    ["欄位篩選", "multiselect()", "篩選欄位資料"],
+    ["日期範圍", "min_date,max_date", "篩選日期資料"],
+    ["資料篩選", "selectbox()", "篩選特定資料"],
+    ["圖表篩選", "selectbox()", "篩選圖表呈現形式"],
+], columns=["功能名稱", "示範關鍵字", "功能介紹"])
+# 分類對應功能名稱清單
+SECTION_MAP = {
+    "全部": FEATURE_TABLE["功能名稱"].tolist(),
+    "1.按鈕功能": ["超連結按鈕", "下載按鈕"],
+    "2.按鈕類型": ["勾選按鈕", "下拉式清單", "單選按鈕"],
+    "3.文字、數字與日期輸入": ["多行文字輸入", "單行文字輸入", "數字輸入", "日期輸入", "時間輸入"],
+    "4.輸入資料應用案例": ["填寫表單範例", "BMI計算器"],
+    "5.流程套件": ["進度條", "進度流程清單", "跳板通知"],
+    "6.檔案上傳與應用": ["使用指南", "檔案上傳", "顯示統計資料", "欄位篩選", "日期範圍", "資料篩選", "圖表篩選"]
+}
+
+
+def render():
+    st.header("🧮 功能介紹")
+    # 選分類
+    selected_category = st.selectbox("請選擇功能分類", list(SECTION_MAP.keys()))
+
+    # 篩選對應功能
+    filtered_names = SECTION_MAP[selected_category]
+    filtered_data = FEATURE_TABLE[FEATURE_TABLE["功能名稱"].isin(filtered_names)]
+
+    # 顯示資料表
+    st.dataframe(filtered_data, use_container_width=True) 
+    if "超連結按鈕" in filtered_names:
+        st.header("1.按鈕功能")
+        st.markdown('#### 超連結按鈕：')
+        st.link_button('前往google首頁','https://www.google.com/?hl=zh_TW', type='primary', help='google連結')
+        st.link_button('前往youtube首頁','https://www.youtube.com/', disabled=True)
+        with st.expander("🔧 :red[Source Code]"):
+            st.code("""
+st.link_button('前往google首頁','https://www.google.com/?hl=zh_TW', type='primary', help='google連結')
+st.link_button('前往youtube首頁','https://www.youtube.com/', disabled=True)""", language="python")
+        st.write("")  # 插入一個空行
+
+    if "下載按鈕" in filtered_names:
+        st.markdown("#### 下載按鈕：")
+        data = {'col1' : [1,2,3,4],'col2' : ['a','b','c','d']}
+        my_large_df = pd.DataFrame(data)
+        def convert_df(df):
+            return df.to_csv(index=False).encode('utf-8')
+        csv = convert_df(my_large_df)
+
+        st.download_button(
+        label="下載 csv",
+        data=csv,
+        file_name='large_df.csv',
+        mime='text/csv'
+        )
+        with st.expander("🔧 :red[Source Code]"):
+            st.code("""
+data = {'col1' : [1,2,3,4],'col2' : ['a','b','c','d']}
+my_large_df = pd.DataFrame(data)
+def convert_df(df):return df.to_csv(index=False).encode('utf-8')
+csv = convert_df(my_large_df)
+                    
+st.download_button(
+label="下載 csv",
+data=csv,
+file_name='large_df.csv',
+mime='text/csv')""", language="python")
+
+    if "下載按鈕" in filtered_names:
+        text_contents = "純文字的text"
+        st.download_button('下載 text', text_contents)
+        with st.expander("🔧 :red[Source Code]"):
+            st.code("""
+text_contents = "純文字的text"
+st.download_button(
+'text下載', 
+text_contents)""", language="python")
+
+    if "下載按鈕" in filtered_names:
+        with open('asus_logo.png', 'rb') as file: #	二進位模式，讀取原始位元資料（✅ 適用於圖片、影片、音訊）
+            st.download_button(    
+            label="下載 png",
+            data=file,
+            file_name='asus_logo.png',
+            mime='image/png'
+            )
+        with st.expander("🔧 :red[Source Code]"):
+            st.code("""
+with open('asus_logo.png', 'rb') as file:
+st.download_button(    
+label="下載 png",
+data=file,
+file_name='asus_logo.png',
+mime='image/png')""", language="python")
+        st.write("")  # 插入一個空行
+
+    if "勾選按鈕" in filtered_names:
+        st.title('2.按鈕類型')
+        st.markdown('#### 勾選按鈕：')
+        apple = st.checkbox('蘋果')
+        banana = st.checkbox('香蕉')
+        cherry = st.checkbox('櫻桃')
+        grape = st.checkbox('葡萄') 
+        if apple or banana or cherry or grape: 
+            st.success('感謝你的填選')
+        with st.expander("🔧 :red[Source Code]"):
+                st.code("""
+apple = st.checkbox('蘋果')
+banana = st.checkbox('香蕉')
+cherry = st.checkbox('櫻桃')
+grape = st.checkbox('葡萄') 
+if apple or banana or cherry or grape: 
+    st.success('感謝你的填選')""", language="python")
+        st.write("")  # 插入一個空行
+
+    if "下拉式清單" in filtered_names:
+        st.markdown('#### 下拉式清單：')
+        fruit_option = st.selectbox("請選擇你喜歡的水果:",['蘋果','香蕉','櫻桃','葡萄'])
+        st.write('你選擇了:',fruit_option)
+        with st.expander("🔧 :red[Source Code]"):
+            st.code("""
+fruit_option = st.selectbox("請選擇你喜歡的水果:",['蘋果','香蕉','櫻桃','葡萄'])
+    st.write('你選擇了:',fruit_option)""", language="python")
+        st.write("")  # 插入一個空行
+
+    if "單選按鈕" in filtered_names:
+        st.markdown('#### 單選按鈕')
+        votes = {
+        '狗 :dog:': 0,
+        '貓 :cat:': 0,
+        '兔子 :rabbit:': 0,
+        '鳥 :bird:': 0,
+        '熊 :bear:': 0
+        }
+        animal = st.radio('請選擇一個動物：',('狗 :dog:', '貓 :cat:', '兔子 :rabbit:', '鳥 :bird:', '熊 :bear:'))
+        if st.button('投票'):
+            votes[animal] += 1
+            st.markdown('### 投票結果：')
+            for animal, count in votes.items():
+                st.markdown(f'{animal}：{count} 票')
+            with st.expander("🔧 :red[Source Code]"):
+                st.code("""
+votes = {
+    '狗 :dog:': 0,
+    '貓 :cat:': 0,
+    '兔子 :rabbit:': 0,
+    '鳥 :bird:': 0,
+    '熊 :bear:': 0
+    }
+animal = st.radio('請選擇一個動物：',('狗 :dog:', '貓 :cat:', '兔子 :rabbit:', '鳥 :bird:', '熊 :bear:'))
+
+if st.button('投票'):
+    votes[animal] += 1
+st.markdown('### 投票結果:')
+for animal, count in votes.items():
+st.markdown(f'{animal}：{count} 票')""", language="python")
+        st.write("")  # 插入一個空行
+
+    if "多行文字輸入" in filtered_names:
+        st.title('3.文字、數字與日期輸入')
+        st.markdown('#### 多行文字輸入：')
+        text=st.text_area("輸入分析文字")
+        st.write(f'你輸入了{len(text)}個字')
+        with st.expander("🔧 :red[Source Code]"):
+            st.code("""
+text=st.text_area("輸入分析文字")
+st.write(f'你輸入了{len(text)}個字')""", language="python")
+        st.write("")  # 插入一個空行
+
+    if "單行文字輸入" in filtered_names:
+        st.markdown('#### 單行文字輸入應用：通關密碼')
+        password = st.text_input('輸入密碼', max_chars=15, type='password')
+        if st.button('密碼確認'): 
+            if password == '88888' :st.write('密碼正確')
+        else: st.write('密碼錯誤')
+
+        with st.expander("🔧 :red[Source Code]"):
+            st.code("""
+password = st.text_input('輸入密碼', max_chars=15, type='password')
+if st.button('密碼確認'): 
+    if password == '88888' :st.write('密碼正確')
+else: st.write('密碼錯誤')""", language="python")
+        st.write("")  # 插入一個空行
+
+    if "數字輸入" in filtered_names:
+        st.markdown("#### 數字輸入：")
+        number = st.number_input('輸入一個數字', value=None, step=5, min_value=0, max_value=1000) #step=5,代表每次數值加5
+        st.write('你輸入的是',number)
+        with st.expander("🔧 :red[Source Code]"):
+            st.code("""
+number = st.number_input('輸入一個數字', value=None, step=5, min_value=0, max_value=1000)
+    st.write('你輸入的是',number)""", language="python")
+        st.write("")  # 插入一個空行
+
+    if "日期輸入" in filtered_names:
+        st.markdown('#### 日期輸入：')
+        birthday = st.date_input('你的生日',datetime.date(1990,1,1))
+        if st.button('生日確認'): st.write('你的生日是', birthday.strftime('%Y年%m月%d日'))
+        with st.expander("🔧 :red[Source Code]"):
+            st.code("""
+birthday = st.date_input('你的生日',datetime.date(1990,1,1))
+    if st.button('生日確認'): st.write('你的生日是', birthday.strftime('%Y年%m月%d日'))""", language="python")
+        st.write("")  # 插入一個空行
+
+    if "時間輸入" in filtered_names:
+        st.markdown('#### 時間輸入：')
+        t = st.time_input('設定自動時間', value=None, step=3600)
+        st.write('自動發信時間',t)
+        with st.expander("🔧 :red[Source Code]"):
+            st.code("""
+t = st.time_input('設定自動時間', value=None, step=3600)
+    st.write('自動發信時間',t)""", language="python")
+        st.write("")  # 插入一個空行
+
+    if "填寫表單範例" in filtered_names:
+        st.title('4.輸入資料應用案例')
+        st.markdown('#### 填寫表單範例：')
+        with st.form(key='form_demo'):
+            form_name = st.text_input(label='姓名',placeholder="請輸入姓名")
+            form_gender = st.selectbox('性別',['男生','女生','其他'])
+            form_birthday = st.date_input('生日')
+            form_height = st.number_input('身高',value=100, min_value=100, max_value=250)
+            form_weight = st.number_input('體重',value=0, min_value=0, max_value=200)
+            submit_button = st.form_submit_button(label='提交')
+        if submit_button: st.success(f'你好，你的姓名為,{form_name},你的資訊已提交完成' )
+        st.toast('已保存你的資料')
+        with st.expander("🔧 :red[Source Code]"):
+            st.code("""
+with st.form(key='form_demo'):
+    form_name = st.text_input(label='姓名',placeholder="請輸入姓名")
+    form_gender = st.selectbox('性別',['男生','女生','其他'])
+    form_birthday = st.date_input('生日')
+    form_height = st.number_input('身高',value=100, min_value=100, max_value=250)
+    form_weight = st.number_input('體重',value=0, min_value=0, max_value=200)
+    submit_button = st.form_submit_button(label='提交')
+if submit_button: st.success(f'你好，你的姓名為,{form_name},你的資訊已提交完成' )
+st.toast('已保存你的資料')""", language="python")
+        st.write("")  # 插入一個空行
+
+    if "BMI計算器" in filtered_names:
+        st.markdown("#### BMI計算器：")
+        height = st.slider("請輸入身高 (cm)", 140, 200, 170)
+        weight = st.number_input("請輸入體重 (kg)", 30.0, 150.0, 60.0)
+        bmi = weight / ((height / 100) ** 2)
+        st.write(f"你的 BMI 是：`{bmi:.2f}`")
+        if bmi < 18.5:
+            st.warning("體重過輕")
+        elif bmi < 24:
+            st.success("體重正常")
+        else:
+            st.error("體重過重")
+        with st.expander("🔧 :red[Source Code]"):
+            st.code("""
+height = st.slider("請輸入身高 (cm)", 140, 200, 170)
+weight = st.number_input("請輸入體重 (kg)", 30.0, 150.0, 60.0)
+bmi = weight / ((height / 100) ** 2)
+st.write(f"你的 BMI 是：{bmi:.2f}")
+if bmi < 18.5:
+st.warning("體重過輕")
+elif bmi < 24:
+st.success("體重正常")
+else:
+st.error("體重過重")""", language="python")
+        st.write("")  # 插入一個空行
+
+    if "進度條" in filtered_names:
+        st.title('5.流程套件')
+        st.markdown('#### 進度條：')
+        progress_text = "正在處理中..."
+        my_bar = st.progress(0, text=progress_text)
+        for percent_complete in range(100):
+            my_bar.progress(percent_complete + 1, text=progress_text + f" {percent_complete + 1}% complete")
+            time.sleep(0.01)
+        my_bar.empty()
+        st.button("Replay") #在 Streamlit 中，每一次使用者有任何互動（例如按按鈕）時，整個 .py 檔案都會從第一行重新執行一次
+        with st.expander("🔧 :red[Source Code]"):
+            st.code("""
+progress_text = "正在處理中..."
+my_bar = st.progress(0, text=progress_text)
+for percent_complete in range(100):
+    my_bar.progress(percent_complete + 1, text=progress_text + f" {percent_complete + 1}% complete")
+    time.sleep(0.01)
+my_bar.empty()
+st.button("Replay")""", language="python")
+        st.write("")  # 插入一個空行
+
+    if "進度流程清單" in filtered_names:
+        st.markdown('#### 進度流程清單：')
+        if st.button('重新執行'):
+            st.status('下載網址中')
+            st.write('搜尋網址中')
+            time.sleep(1)
+            st.write('搜尋數據中')
+            time.sleep(1)
+            st.write('下載完成')
+        with st.expander("🔧 :red[Source Code]"):
+            st.code("""
+if st.button('重新執行'):
+    st.status('下載網址中')
+    st.write('搜尋網址中')
+    time.sleep(1)
+    st.write('搜尋數據中')
+    time.sleep(1)
+    st.write('下載完成')""", language="python")
+        st.write("")  # 插入一個空行
+
+    if "跳板通知" in filtered_names:
+        st.markdown('#### 跳板通知：')
+        if st.button('存檔', type='primary'):
+            st.toast('已保存你的圖片')
+            time.sleep(1)
+            st.toast('警告!儲存失敗')
+            st.snow()
+        with st.expander("🔧 :red[Source Code]"):
+            st.code("""
+if st.button('存檔', type='primary'):
+    st.toast('已保存你的圖片')
+    time.sleep(1)
+    st.toast('警告!儲存失敗')
+    st.snow()""", language="python")
+        st.write("")  # 插入一個空行
+
+    if "使用指南" in filtered_names:
+        st.title('6.檔案上傳與應用')
+        st.markdown('#### 使用指南：')  
+        with st.expander('使用指南'):
+            st.write('Excel可視覺化應用程序')
+            st.write('1.上傳Excel') 
+            st.write('2.選擇顯示統計資料')
+            st.write('3.篩選欄位功能') 
+            st.write('4.選擇顯示日期')
+            st.write('5.選擇顯示欄位')
+            st.write('6.選擇顯示圖表')
+        with st.expander("🔧 :red[Source Code]"):
+            st.code("""
+with st.expander('使用指南'):
+    st.write('Excel可視覺化應用程序')
+    st.write('1.上傳Excel') 
+    st.write('2.選擇顯示統計資料')
+    st.write('3.篩選欄位功能') 
+    st.write('4.選擇顯示日期')
+    st.write('5.選擇顯示欄位')
+    st.write('6.選擇顯示圖表')""", language="python")
+        st.write("")  # 插入一個空行
+
+    if "檔案上傳" in filtered_names:
+        st.markdown('#### 檔案上傳：')
+        uploaded_file = st.file_uploader("上傳Excel檔案", type=["csv", "xlsx"], accept_multiple_files=True) #允許上傳多個文件
+        select_file = st.selectbox('選擇要查看的Excel文件', uploaded_file, format_func=lambda x: x.name)
+        df = None
+        dataset_key = None
+        if select_file is not None:
+            # 以檔案內容雜湊快取解析結果（core/ingest.py），勾選 / 篩選等互動不再重新解析整份檔案
+            # 載入後一併壓縮欄位型別（category / 較小數值型別 / 日期），之後各段都用壓縮後的 df
+            # 「銷售日期」在載入時就轉成日期並排序，日期範圍篩選可直接二分搜尋
+            df, load_info = load_uploaded_frame(
+                select_file,
+                get_frame_cache(int(get_setting("UPLOAD_CACHE_MB", 512))),
+                sort_by="銷售日期",
+            )
+            dataset_key = load_info["key"]
+            st.caption(memory_caption(load_info["memory"]))
+        with st.expander("🔧 :red[Source Code]"):
+            st.code("""
+uploaded_file = st.file_uploader("上傳Excel檔案", type=["csv", "xlsx"], accept_multiple_files=True) #允許上傳多個文件
+select_file = st.selectbox('選擇要查看的Excel文件', uploaded_file, format_func=lambda x: x.name)
+if select_file is not None:
+    file_extension = select_file.name.split('.')[-1]
+    if file_extension.lower() == 'csv':
+        df = pd.read_csv(select_file)
+    else:
+        df = pd.read_excel(select_file, engine='openpyxl')""", language="python")
+        st.write("")  # 插入一個空行
+
+    if "顯示統計資料" in filtered_names:
+        st.markdown('#### 顯示統計資料：')
+        if df is not None:
+            show_summary=st.checkbox('顯示統計摘要')
+            if show_summary:
+                #每份檔案只統計一次（core/stats.py）；大檔預設用抽樣近似分位數，可切回精確值
+                exact = st.toggle('精確統計', value=len(df) < APPROX_MIN_ROWS, key='summary_exact')
+                summary, summary_info = get_describe(dataset_key, False, exact, df)
+                st.write('數據摘要統計:')
+                st.write(summary)
+                st.caption(stats_caption(summary_info))
+        with st.expander("🔧 :red[Source Code]"):
+            st.code("""    
+if df is not None:
+    show_summary=st.checkbox('顯示統計摘要')
+    if show_summary:
+        exact = st.toggle('精確統計', value=len(df) < APPROX_MIN_ROWS)
+        summary, summary_info = get_describe(dataset_key, False, exact, df)   # 每份檔案只算一次
+        st.write('數據摘要統計:')
+        st.write(summary)
+        st.caption(stats_caption(summary_info))""", language="python")
+        st.write("")  # 插入一個空行
+
+    if "欄位篩選" in filtered_names:
+        st.markdown('#### 欄位篩選：')
+        if df is not None:
+            multiselected_columns = st.multiselect('選擇顯示的欄位',df.columns)
+            if multiselected_columns:
+                st.write('選定的欄位')
+                st.write(df[multiselected_columns])    
+        with st.expander("🔧 :red[Source Code]"):
+            st.code("""    
+if df is not None:
+    multiselected_columns = st.multiselect('選擇顯示的欄位',df.columns)
+    if multiselected_columns:
+        st.write('選定的欄位')
+        st.write(df[multiselected_columns])""", language="python")
+        st.write("")  # 插入一個空行
+
+    if "日期範圍" in filtered_names:
+        st.markdown('#### 日期範圍：')
+    #日期篩選（df 已在載入時依「銷售日期」排序，用二分搜尋取連續切片，不必每次建布林遮罩）
+        df_filtered = df
+        row_range = (0, len(df) if df is not None else 0)   # df_filtered 在 df 中的列位置 [lo, hi)
+        if df is not None and '銷售日期' in df.columns:
+            min_ts, max_ts = date_bounds(df, '銷售日期')
+            if min_ts is not None:
+                min_date, max_date = min_ts.date(), max_ts.date()
+                date_range = st.date_input('選擇日期範圍',(min_date,max_date))
+                #日期區間還沒選完（只點了起始日）時，先沿用資料的最後一天
+                strat_date = date_range[0] if date_range else min_date
+                end_date = date_range[1] if len(date_range) > 1 else max_date
+                #進行日期篩選數據
+                row_range = date_slice_bounds(df, '銷售日期', strat_date, end_date)
+                df_filtered = df.iloc[row_range[0]:row_range[1]]
+        with st.expander("🔧 :red[Source Code]"):
+            st.code("""
+if '銷售日期' in df.columns:
+    min_ts, max_ts = date_bounds(df, '銷售日期')      # df 已依日期排序：首尾即最小 / 最大
+    min_date, max_date = min_ts.date(), max_ts.date()
+    date_range = st.date_input('選擇日期範圍',(min_date,max_date))
+    strat_date = date_range[0]
+    end_date = date_range[1] if len(date_range) > 1 else max_date
+    row_range = date_slice_bounds(df, '銷售日期', strat_date, end_date)   # searchsorted 取列位置 [lo, hi)
+    df_filtered = df.iloc[row_range[0]:row_range[1]]""", language="python")
+        st.write("")  # 插入一個空行
+
+     #視覺化欄位選擇
+    if "資料篩選" in filtered_names:
+        st.markdown('#### 資料篩選：')
+        category_column = st.selectbox("選擇分類欄位（如型號）", [col for col in df_filtered.columns if any(x in col for x in ['型號', '地區', '通路'])])
+        if category_column:
+            #分類欄的倒排索引（值 → 列位置）每份檔案每個欄位只建一次，之後切換細項 / 日期都只做二分搜尋
+            group_index = get_group_index(dataset_key, category_column, df)
+            unique_values = group_index.values_in(*row_range)
+            filter_values = st.multiselect(f"選擇『{category_column}』的細項值", unique_values, default=unique_values[:1])
+            if filter_values:
+                df_filtered = df.iloc[group_index.positions(filter_values, *row_range)]
+        selected_column = st.selectbox("選擇欄位", [col for col in df_filtered.columns if any(x in col for x in ['數量', '金額', '單價'])])
+        with st.expander("🔧 :red[Source Code]"):
+            st.code("""
+category_column = st.selectbox("選擇分類欄位（如型號）", [col for col in df_filtered.columns if any(x in col for x in ['型號', '地區', '通路'])])
+if category_column:
+    group_index = get_group_index(dataset_key, category_column, df)   # 值 → 列位置，每欄只建一次
+    unique_values = group_index.values_in(*row_range)                  # 只列出日期範圍內出現的值
+    filter_values = st.multiselect(f"選擇『{category_column}』的細項值", unique_values, default=unique_values[:1])
+    if filter_values:
+        df_filtered = df.iloc[group_index.positions(filter_values, *row_range)]
+selected_column = st.selectbox("選擇欄位", [col for col in df_filtered.columns if any(x in col for x in ['數量', '金額', '單價'])])""", language="python")
+        st.write("")  # 插入一個空行
+
+    #視覺化類型選擇  
+    if "圖表篩選" in filtered_names:
+        st.markdown('#### 圖表篩選：')
+        df_chart = df_filtered[['銷售日期', selected_column]].set_index('銷售日期')
+        chart_type = st.selectbox('選擇圖表類型',['折線圖','柱狀圖','散點圖'])
+        #折線 / 散點先降採樣到約圖表寬度再送到瀏覽器（折線用 LTTB、散點用每桶最小 / 最大值，峰值都保留）
+        max_points = int(get_setting("CHART_MAX_POINTS", DEFAULT_MAX_POINTS))
+        if chart_type == '折線圖':
+            df_plot, points = downsample(df_chart, selected_column, max_points=max_points)
+            st.line_chart(df_plot)
+            st.caption(points_caption(points))
+        elif chart_type == '柱狀圖':
+            st.bar_chart(df_chart)
+        elif chart_type == '散點圖':
+            df_plot, points = downsample(df_chart, selected_column, max_points=max_points, method="minmax")
+            st.scatter_chart(df_plot)
+            st.caption(points_caption(points))
+        with st.expander("🔧 :red[Source Code]"):
+            st.code("""
+df_chart = df_filtered[['銷售日期', selected_column]].set_index('銷售日期')
+chart_type = st.selectbox('選擇圖表類型',['折線圖','柱狀圖','散點圖'])
+if chart_type == '折線圖':
+    df_plot, points = downsample(df_chart, selected_column)                     # LTTB
+    st.line_chart(df_plot)
+    st.caption(points_caption(points))
+elif chart_type == '柱狀圖':
+    st.bar_chart(df_chart)
+elif chart_type == '散點圖':
+    df_plot, points = downsample(df_chart, selected_column, method="minmax")   # 每桶最小 / 最大值
+    st.scatter_chart(df_plot)
+    st.caption(points_caption(points))""", language="python")
+        st.write("")  # 插入一個空行
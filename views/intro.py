@@ -0,0 +1,90 @@
+"""
+📘 Streamlit：教學首頁（學習地圖、簡介、套件安裝）。
+"""
+import streamlit as st
+
+
+def render():
+    # ✅ 頁面設定
+    st.set_page_config(page_title="Learning Streamlit - Streamlit 教學", layout="centered")
+
+    # ✅ 加入簡單動畫樣式（LOGO 預留）
+    st.markdown("""
+    <style>
+    @keyframes fadeInZoom {
+        0% { opacity: 0; transform: scale(0.5); }
+        100% { opacity: 1; transform: scale(1); }
+    }
+    .animated-logo {
+        animation: fadeInZoom 1s ease-in-out;
+    }
+    </style>
+    """, unsafe_allow_html=True)
+
+    # ✅ 頁首文字介紹
+    st.markdown("""
+    <h1 style='text-align: center;'>🚀 Streamlit 教學</h1>
+    <p style='text-align: center;'>透過這個頁面，你將快速掌握 Streamlit 的基本觀念與安裝方式。</p>
+    <p style='text-align: center;'>請點選下方分頁開始學習 📘</p>
+    """, unsafe_allow_html=True)
+
+    # ✅ 分頁導覽
+    tabs = st.tabs(["🗺 Overview", "📘 Streamlit 簡介", "🔧 套件安裝"])
+
+    # 🔹 分頁 1：Overview
+    with tabs[0]:
+        st.subheader("🗺 Overview - 教學導覽")
+        st.markdown("""
+        在進入實作前，先了解 **Streamlit 學習地圖**：
+
+        - 🧱 **頁面架構**：學會使用 `st.title()`、`st.markdown()` 設計頁面內容
+        - 🎛 **互動元件**：如 `st.button()`、`st.selectbox()` 等 UI 控制項
+        - 📈 **資料與圖表呈現**：利用 `pandas`、`matplotlib` 或 `plotly` 顯示資料與可視化
+        - ✨ **強化功能**：運用 `streamlit-extras`、`streamlit-echarts` 增加互動性與美觀性
+
+        📌 建議你依照順序閱讀分頁，從「簡介」👉「安裝」👉「實作」。
+        """)
+
+    # 🔹 分頁 2：Streamlit 簡介
+    with tabs[1]:
+        st.subheader("📘 什麼是 Streamlit？")
+        st.markdown("""
+        Streamlit 是一個能讓你用 **純 Python 語法快速建立 Web 應用程式** 的工具。  
+        適用於：資料分析、AI Demo、即時互動式工具製作等。
+
+        ### 🔧 執行方式：
+        ```bash
+        streamlit run app.py
+        ```
+
+        ### 🚀 Streamlit 的優點：
+        - 不用寫 HTML / JS，也能做網頁
+        - 元件簡單好上手（如 `st.button()`）
+        - 支援互動與圖表
+        - 快速部署，適合展示 AI / 數據成果
+
+        🌐 [Streamlit 官方展示](https://extras.streamlit.app)
+        """)
+
+    # 🔹 分頁 3：套件安裝說明
+    with tabs[2]:
+        st.subheader("🔧 套件安裝與用途說明")
+        st.markdown("""
+        以下是我們常用到的套件與對應功能：
+
+        | 套件名稱 | 功能說明 |
+        |-----------|-----------|
+        | `streamlit` | 建立網頁與 UI 元件（核心套件） |
+        | `streamlit-extras` | 額外元件，如徽章、連結、排版輔助等 |
+        | `pandas` | 資料整理與表格顯示 |
+        | `numpy` | 數值運算、模擬數據 |
+        | `matplotlib` | 基本圖表（長條圖、折線圖等） |
+        | `seaborn` | 高階統計圖表視覺化 |
+        | `openpyxl` | Excel（.xlsx）檔案讀寫 |
+        | `streamlit-echarts` | 使用 ECharts 繪製互動圖表 |
+
+        ### 📦 安裝指令（建議一併安裝）：
+        ```bash
+        pip install streamlit streamlit-extras pandas numpy matplotlib seaborn streamlit-echarts openpyxl
+        ```
+        """)
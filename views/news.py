@@ -0,0 +1,233 @@
+"""
+🕴 GAI 新聞摘要：背景爬取新聞並以 LLM 分類議題，之後可篩選、看分佈圖並對新聞發問。
+"""
+import streamlit as st
+
+from core.clients import client_settings, get_openrouter_client, get_setting, openrouter_secrets
+from core.figures import use_cjk_fonts
+from core.http_cache import get_http_cache
+from core.jobs import NewsSearchJob
+from core.lazy import lazy_import
+from core.llm import StreamStats, get_rate_limiter, llm_rate_caption
+from core.reply_cache import get_reply_cache
+from core.retrieval import BM25Index, news_passages
+from core.timing import timed_fragment
+from core.topic_cache import get_topic_cache
+
+pd = lazy_import("pandas")
+plt = lazy_import("matplotlib.pyplot")
+
+# ---------- 爬蟲設定（抓取邏輯在 core/crawler.py，同時抓多個網站與文章） ----------
+CRAWL_DEADLINE = 45      # 整體截止秒數，逾時先回傳已抓到的部分結果
+CRAWL_PER_HOST = 2       # 每個網站同時請求數上限，避免被擋
+
+QA_CONTEXT_TOKENS = 1500  # 問答 prompt 中新聞脈絡的 token 預算
+
+# url/tag：列表頁與標題標籤；content：文章內文選擇器（沒命中時自動退回通用標籤）
+PLATFORMS = {
+    "ETtoday新聞雲": {"url": "https://www.ettoday.net/news/tag/ASUS/", "tag": "h3", "content": ["div.story"]},
+    "聯合新聞網":   {"url": "https://udn.com/search/tagging/2/ASUS", "tag": "h2", "content": ["section.article-content__editor"]},
+    "蘋果日報":     {"url": "https://tw.nextapple.com/search/asus", "tag": "h2", "content": ["div.post-content"]},
+    "中時新聞":     {"url": "https://www.chinatimes.com/search/ASUS?chdtv", "tag": "h3", "content": ["div.article-body"]},
+}
+
+# 搜尋在背景工作（core/jobs.py）中執行：rerun 不會中斷，分類完成的新聞即時出現在下方表格，可隨時取消
+NEWS_COLUMNS = ["議題", "新聞媒體", "新聞標題", "新聞內容", "新聞網址"]
+JOB_POLL_SECONDS = 1.0
+
+
+def _finish_news_job(job):
+    """背景工作結束後（主執行緒）寫入結果：建 DataFrame、檢索索引與議題清單。"""
+    messages = [("warning", msg) for msg in job.errors]
+    messages.append(("caption", get_http_cache().caption()))
+    if job.timed_out:
+        messages.append(("info", f"抓取超過 {CRAWL_DEADLINE} 秒，先以已完成的新聞繼續分析。"))
+    if job.status == "cancelled":
+        messages.append(("info", f"已取消搜尋，保留已分類的 {len(job.rows)} 則新聞。"))
+
+    # 安全重排欄位，缺的自動補 NaN，避免 KeyError
+    df = pd.DataFrame(job.results()).reindex(columns=NEWS_COLUMNS)
+    st.session_state["topic_cache_hits"] = (job.cache_hits, len(df))
+    if df.empty or df["新聞標題"].isna().all():
+        messages.append(("warning", "沒有抓到符合關鍵字的新聞，請更換關鍵字或平台重試。"))
+    else:
+        missing = [c for c in NEWS_COLUMNS if df[c].isna().all()]
+        if missing:
+            messages.append(("info", f"部分欄位缺少資料：{', '.join(missing)}。"))
+        st.session_state["news_df"] = df
+        st.session_state["news_index"] = BM25Index(news_passages(df))  # 問答檢索用，每次搜尋只建一次
+        topics = [t for t in df["議題"].dropna().unique().tolist() if t]
+        st.session_state["topics"] = sorted(topics) if topics else ["未分類"]
+        if job.status == "done":
+            messages.append(("success", "✅ 抓取完成！下方可進行篩選與分析。"))
+    st.session_state["news_job_messages"] = messages
+    st.session_state["news_job_finished"] = job.id
+
+
+def _news_job_panel():
+    """輪詢背景工作：顯示逐則進度與已分類的新聞；結束時寫入結果並整頁重跑一次。"""
+    job = st.session_state.get("news_job")
+    if job is None:
+        return
+    if not job.running:
+        if st.session_state.get("news_job_finished") != job.id:
+            _finish_news_job(job)
+            st.rerun()
+        return
+    snap = job.snapshot()
+    stage = "分類中" if snap["crawl_done"] else "抓取與分類中"
+    st.progress(
+        snap["classified"] / snap["fetched"] if snap["fetched"] else 0.0,
+        text=f"{stage}…已抓到 {snap['fetched']} 則、已分類 {snap['classified']} 則（{snap['elapsed']:.0f} 秒）",
+    )
+    if snap["rows"]:
+        st.dataframe(pd.DataFrame(snap["rows"]).reindex(columns=NEWS_COLUMNS), use_container_width=True)
+    if st.button("⏹ 取消搜尋", key="news_job_cancel"):
+        job.cancel()
+
+
+def render():
+    # ---------- OpenRouter API 初始化（用 secrets.toml） ----------
+    # Client 為行程共用單例（core/clients.py），rerun 時不再重建、保留連線池
+    openrouter = openrouter_secrets()
+    if not openrouter["api_key"]:
+        st.error("找不到 OPENROUTER_API_KEY，請在 `.streamlit/secrets.toml` 或 Streamlit Cloud 的 Secrets 面板設定後再執行。")
+        st.stop()
+
+    # 所有 chat.completions.create 都經過共用節流器（token bucket + 429 退避，見 core/llm.py）
+    llm_limiter = get_rate_limiter(**client_settings("RATE_"))
+    client = llm_limiter.wrap(get_openrouter_client(**openrouter, **client_settings("LLM_")))
+    reply_cache = get_reply_cache(**client_settings("REPLY_CACHE_"))   # 相同請求直接回放（磁碟 SQLite，TTL + LRU）
+
+    # 議題分類快取（SQLite，跨使用者 / 重啟共用）
+    topic_cache = get_topic_cache(
+        get_setting("TOPIC_CACHE_PATH", ".cache/topics.sqlite3"),
+        int(get_setting("TOPIC_CACHE_MAX_ENTRIES", 20000)),
+    )
+
+    # =========================================================
+    # 🧱 UI：主畫面
+    # =========================================================
+    st.header("  🕴 GAI 新聞摘要")
+
+    keyword = st.text_input("請輸入要搜尋的關鍵字（例如：華碩）", value="華碩")
+
+    selected_sites = st.multiselect("📍 請選擇新聞平台（可複選）", list(PLATFORMS.keys()))
+
+    if st.button("🔍 搜尋新聞"):
+        if not selected_sites:
+            st.warning("請先選擇至少一個新聞平台。")
+        else:
+            previous = st.session_state.get("news_job")
+            if previous is not None and previous.running:
+                previous.cancel()
+            st.session_state["news_job"] = NewsSearchJob(
+                client,
+                {name: PLATFORMS[name] for name in selected_sites},
+                keyword,
+                topic_cache=topic_cache,
+                per_host=CRAWL_PER_HOST,
+                deadline=CRAWL_DEADLINE,
+            ).start()
+
+    # 只有工作進行中才定時輪詢；結束後 fragment 不再自動重跑
+    news_job = st.session_state.get("news_job")
+    running = news_job is not None and news_job.running
+    timed_fragment("搜尋進度", run_every=JOB_POLL_SECONDS if running else None, caption=running)(_news_job_panel)()
+
+    for level, msg in st.session_state.get("news_job_messages", []):
+        getattr(st, level)(msg)
+
+    # =========================================================
+    # 🔎 分析與互動
+    # =========================================================
+    if "news_df" in st.session_state:
+        # 議題篩選、圖表與問答只依賴已存好的搜尋結果：包成 fragment，操作這裡不重跑上方搜尋區與整頁
+        @timed_fragment("新聞分析")
+        def _news_analysis_section():
+            df = st.session_state["news_df"]
+            unique_topics = st.session_state["topics"]
+
+            selected_topics = st.multiselect("🧠 請選擇篩選的議題（可複選）", unique_topics, default=unique_topics, key="topic_filter")
+            filtered_df = df[df["議題"].isin(selected_topics)].copy()
+
+            st.dataframe(filtered_df, use_container_width=True)
+
+            # 🗃 議題快取命中率（本次搜尋 / 行程累計）
+            cache_stats = topic_cache.stats()
+            last_hits, last_total = st.session_state.get("topic_cache_hits", (0, 0))
+            st.caption(
+                f"🗃 議題快取：本次搜尋命中 {last_hits}/{last_total} 則；"
+                f"累計命中率 {cache_stats['hit_rate']:.0%}（{cache_stats['hits']} 命中 / {cache_stats['misses']} 未命中），"
+                f"快取 {cache_stats['entries']}/{cache_stats['max_entries']} 筆"
+            )
+            st.caption(llm_rate_caption(llm_limiter))
+
+            # 📊 議題分佈長條圖（極小版、可自適應）
+            st.markdown("### 📊 圖表分析：各議題新聞分佈")
+            if filtered_df.empty:
+                st.info("目前篩選條件下沒有資料。")
+            else:
+                topic_counts = filtered_df["議題"].value_counts()
+                use_cjk_fonts()
+                fig, ax = plt.subplots(figsize=(3, 1), dpi=300)  # 小尺寸高 DPI
+                bars = ax.bar(topic_counts.index, topic_counts.values)
+                for bar in bars:
+                    h = bar.get_height()
+                    ax.text(bar.get_x() + bar.get_width() / 2, h, f"{int(h)}",
+                            ha="center", va="bottom", fontsize=8)
+                ax.set_ylabel("新聞數量", fontsize=8)
+                ax.tick_params(axis="x", labelsize=8)
+                ax.tick_params(axis="y", labelsize=8)
+                st.pyplot(fig, use_container_width=True, clear_figure=True)
+                plt.close(fig)
+
+            # 💬 使用者提問（依當前篩選結果生成脈絡）
+            st.markdown("### 💬 對這些新聞內容發問")
+            user_question = st.text_area("請輸入你的問題（例如：這些新聞中有哪些未來趨勢？）", key="qa_question")
+
+            bypass_reply_cache = st.toggle("略過回覆快取（重新生成）", key="qa_bypass_cache")
+
+            if st.button("送出提問", key="qa_submit") and user_question:
+                if filtered_df.empty:
+                    st.warning("目前沒有可供分析的新聞內容，請先進行搜尋或調整篩選條件。")
+                else:
+                    # 依 BM25 相關度挑出與問題最相關的新聞，總長度控制在 QA_CONTEXT_TOKENS 內
+                    news_index = st.session_state.get("news_index")
+                    if news_index is None:
+                        news_index = st.session_state["news_index"] = BM25Index(news_passages(df))
+                    picked = news_index.select(user_question, QA_CONTEXT_TOKENS, candidates=df.index.get_indexer(filtered_df.index))
+                    context_text = "\n\n".join(news_index.docs[i] for i in picked)
+
+                    full_prompt = (
+                        "以下是多則新聞內容，請根據使用者的問題給出具體回覆。\n\n"
+                        f"使用者提問：{user_question}\n\n"
+                        f"新聞資料：{context_text}"
+                    )
+
+                    # 串流回覆：收到第一段就開始顯示，不必等整段生成完；同樣的提問與脈絡直接回放快取
+                    st.markdown("### 🤖 LLM 回覆")
+                    stream_stats = StreamStats()
+                    reply_status = {}
+                    try:
+                        st.write_stream(stream_stats.track(reply_cache.stream(
+                            client,
+                            bypass=bypass_reply_cache,
+                            status=reply_status,
+                            model="deepseek/deepseek-chat",
+                            messages=[
+                                {
+                                    "role": "system",
+                                    "content": "你是一位中文新聞分析助手，請根據提供的新聞內容與使用者問題給出清晰、簡潔、具體的中文回應。"
+                                },
+                                {"role": "user", "content": full_prompt}
+                            ],
+                            temperature=0.5,
+                            max_tokens=600
+                        )))
+                        st.caption(stream_stats.caption())
+                        st.caption(reply_cache.caption(reply_status))
+                    except Exception as e:
+                        st.error(f"回覆失敗：{e}")
+
+        _news_analysis_section()
@@ -0,0 +1,86 @@
+"""
+🔗 參考資料：streamlit-extras 常用元件（空白、徽章、提及連結）介紹。
+"""
+import streamlit as st
+
+from core.lazy import lazy_attr
+
+add_vertical_space = lazy_attr("streamlit_extras.add_vertical_space", "add_vertical_space")
+badge = lazy_attr("streamlit_extras.badges", "badge")
+mention = lazy_attr("streamlit_extras.mention", "mention")
+
+
+def render():
+    st.header("🎨 進階排版與功能加強（streamlit-extras 功能介紹）")
+
+    st.markdown("""
+    `streamlit-extras` 提供許多輔助元件，讓頁面更有彈性、更好用。
+    安裝方式：
+    ```bash
+    pip install streamlit-extras
+    ```
+    """)
+
+    st.subheader("1. 增加垂直間距")
+    st.write("上方段落")
+    add_vertical_space(2)
+    st.write("下方段落（中間有空白）")
+
+    st.subheader("2. 顯示徽章 badge")
+    badge(type="github", name="arnaudmiribel/streamlit-extras")
+    badge(type="pypi", name="streamlit-extras")
+    badge(type="twitter", name="streamlit")
+    badge(type="buymeacoffee", name="arnaudmiribel")
+
+    st.subheader("3. 快速連結提示 mention")
+    mention(label="查看 Streamlit 官方網站", icon="🌐", url="https://streamlit.io")
+    with st.expander("🔧 :red[Source Code]"):
+        st.code("""
+st.write("上方段落")
+add_vertical_space(2)
+st.write("下方段落（中間有空白）")
+
+badge(type="github", name="arnaudmiribel/streamlit-extras")
+badge(type="pypi", name="streamlit-extras")
+badge(type="twitter", name="streamlit")
+badge(type="buymeacoffee", name="arnaudmiribel")
+
+mention(label="查看 Streamlit 官方網站", icon="🌐", url="https://streamlit.io")
+        """, language="python")    
+
+    st.header("🎨 進階排版與功能加強（streamlit-extras 功能介紹）")
+
+    st.markdown("""
+    `streamlit-extras` 提供許多輔助元件，讓頁面更有彈性、更好用。
+    安裝方式：
+    ```bash
+    pip install streamlit-extras
+    ```
+    """)
+
+    st.subheader("1. 增加垂直間距")
+    st.write("上方段落")
+    add_vertical_space(2)
+    st.write("下方段落（中間有空白）")
+
+    st.subheader("2. 顯示徽章 badge")
+    badge(type="github", name="arnaudmiribel/streamlit-extras")
+    badge(type="pypi", name="streamlit-extras")
+    badge(type="twitter", name="streamlit")
+    badge(type="buymeacoffee", name="arnaudmiribel")
+
+    st.subheader("3. 快速連結提示 mention")
+    mention(label="查看 Streamlit 官方網站", icon="🌐", url="https://streamlit.io")
+    with st.expander("🔧 :red[Source Code]"):
+        st.code("""
+st.write("上方段落")
+add_vertical_space(2)
+st.write("下方段落（中間有空白）")
+
+badge(type="github", name="arnaudmiribel/streamlit-extras")
+badge(type="pypi", name="streamlit-extras")
+badge(type="twitter", name="streamlit")
+badge(type="buymeacoffee", name="arnaudmiribel")
+
+mention(label="查看 Streamlit 官方網站", icon="🌐", url="https://streamlit.io")
+        """, language="python")